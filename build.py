@@ -2,44 +2,55 @@
 Build script for creating Windows executable
 Run this script to create a standalone .exe file
 Use --debug flag to create executable with console for debugging
+Use --onefile flag to bundle everything into a single .exe (slower startup)
 """
 
+import argparse
 import os
 import sys
 import subprocess
 
+_HERE = os.path.dirname(os.path.abspath(__file__))
+ICON_PATH = os.path.join(_HERE, 'icon.ico')
+
 def create_icon():
     """Create the icon file if it doesn't exist."""
-    icon_path = os.path.join(os.path.dirname(__file__), 'icon.ico')
+    icon_path = ICON_PATH
     if not os.path.exists(icon_path):
         print("Creating icon...")
         try:
-            subprocess.run([sys.executable, 'create_icon.py'], check=True)
-        except subprocess.CalledProcessError:
+            # Call in-process instead of spawning a fresh interpreter
+            from create_icon import create_icon as make_icon
+            make_icon()
+        except (ImportError, OSError):
             print("Warning: Could not create icon, proceeding without icon.")
             return None
     return icon_path
 
-def build_exe(debug=False):
+def build_exe(debug=False, onefile=False):
     """Build the executable using PyInstaller.
-    
+
     Args:
         debug: If True, build with console window for debugging
+        onefile: If True, build a single-file executable (slower startup
+                 because the archive is extracted on every launch)
     """
-    
+
     # Create icon if needed
     icon_path = create_icon()
     icon_arg = f'--icon={icon_path}' if icon_path else '--icon=NONE'
-    
+
     # PyInstaller command using python -m to ensure it works
     cmd = [
         sys.executable, '-m', 'PyInstaller',
         '--name=NewsAPI_Automation_Debug' if debug else '--name=NewsAPI_Automation',
         '--console' if debug else '--windowed',  # Console for debug, windowed for release
-        '--onefile',    # Single executable file
+        '--onefile' if onefile else '--onedir',  # onedir avoids per-launch archive extraction
+        '--optimize=1',  # Bundle precompiled .pyc so the frozen app skips compilation
         icon_arg,
-        '--add-data=.env;.',  # Embed .env file in the executable
+        f'--add-data=prompts{os.pathsep}prompts',  # Prompt text files loaded at runtime
         '--hidden-import=PIL._tkinter_finder',  # Required for PIL with Tkinter
+        '--hidden-import=win32clipboard',  # Imported lazily for image copy
         '--hidden-import=tkinter',
         '--hidden-import=tkinter.ttk',
         '--hidden-import=tkinter.scrolledtext',
@@ -51,6 +62,14 @@ def build_exe(debug=False):
         '--hidden-import=zai_prompts',
         '--hidden-import=tuning_search',
         '--hidden-import=config',
+        # Trim stdlib modules the GUI never uses to shrink the archive
+        '--exclude-module=unittest',
+        '--exclude-module=pydoc',
+        '--exclude-module=xmlrpc',
+        '--exclude-module=test',
+        '--exclude-module=pdb',
+        '--exclude-module=distutils',
+        '--exclude-module=lib2to3',
         'gui_app.py'
     ]
     
@@ -64,8 +83,12 @@ def build_exe(debug=False):
         print("\n" + "="*60)
         print("✓ Build successful!")
         print("="*60)
-        exe_name = "NewsAPI_Automation_Debug.exe" if debug else "NewsAPI_Automation.exe"
-        print(f"\nExecutable location: dist/{exe_name}")
+        app_name = "NewsAPI_Automation_Debug" if debug else "NewsAPI_Automation"
+        if onefile:
+            print(f"\nExecutable location: dist/{app_name}.exe")
+        else:
+            print(f"\nExecutable location: dist/{app_name}/{app_name}.exe")
+            print(f"\nNote: Distribute the whole dist/{app_name}/ folder.")
         print("\nNote: Make sure .env file exists in the same directory as the .exe")
         print("      The images folder will be created automatically.")
     except subprocess.CalledProcessError as e:
@@ -73,5 +96,10 @@ def build_exe(debug=False):
         sys.exit(1)
 
 if __name__ == "__main__":
-    debug_mode = '--debug' in sys.argv
-    build_exe(debug=debug_mode)
+    parser = argparse.ArgumentParser(description="Build the Windows executable")
+    parser.add_argument('--debug', action='store_true',
+                        help='build with a console window for debugging')
+    parser.add_argument('--onefile', action='store_true',
+                        help='bundle into a single .exe (slower startup)')
+    args = parser.parse_args()
+    build_exe(debug=args.debug, onefile=args.onefile)
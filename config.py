@@ -3,70 +3,118 @@ Configuration module for NewsAPI Automation App.
 Loads environment variables from .env file.
 """
 
+import functools
 import os
 import sys
-from dotenv import load_dotenv
-
-# Determine the directory of the executable or script
-if getattr(sys, 'frozen', False):
-    # Running as a PyInstaller executable
-    application_path = os.path.dirname(sys.executable)
-    print(f"[DEBUG] Running as executable from: {application_path}")
-    
-    # Try to find .env in multiple locations (in order of priority):
-    # 1. PyInstaller temp folder (embedded .env)
-    # 2. Same directory as executable (external .env)
-    
-    # PyInstaller temp folder path
-    bundle_dir = getattr(sys, '_MEIPASS', os.path.abspath(os.path.dirname(__file__)))
-    env_paths = [
-        os.path.join(bundle_dir, '.env'),  # Embedded in executable
-        os.path.join(application_path, '.env'),  # External file next to exe
-    ]
-else:
-    # Running as a normal Python script
-    application_path = os.path.dirname(os.path.abspath(__file__))
-    print(f"[DEBUG] Running as script from: {application_path}")
-    env_paths = [os.path.join(application_path, '.env')]
-
-# Try each .env path
-env_loaded = False
-for env_path in env_paths:
-    print(f"[DEBUG] Looking for .env at: {env_path}")
-    print(f"[DEBUG] .env exists: {os.path.exists(env_path)}")
-    if os.path.exists(env_path):
-        loaded = load_dotenv(env_path)
-        print(f"[DEBUG] load_dotenv returned: {loaded}")
-        if loaded:
-            env_loaded = True
-            print(f"[DEBUG] Loaded .env from: {env_path}")
-            break
-
-if not env_loaded:
-    print(f"[DEBUG] WARNING: No .env file found in any location!")
+from dotenv import dotenv_values
+
+# Debug prints are off unless NEWSAPI_DEBUG is set in the environment
+_dbg = print if os.getenv("NEWSAPI_DEBUG") else (lambda *args, **kwargs: None)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env() -> dict:
+    """
+    Resolve and parse the first available .env file.
+
+    Cached so re-imports (e.g. in subprocesses spawned by build.py) don't
+    re-stat and re-parse the file. Parsed values are merged into os.environ
+    on first load without overriding variables already set in the process.
+
+    Returns:
+        Dictionary of values parsed from the .env file (empty if none found)
+    """
+    if getattr(sys, 'frozen', False):
+        # Running as a PyInstaller executable
+        application_path = os.path.dirname(sys.executable)
+        _dbg(f"[DEBUG] Running as executable from: {application_path}")
+
+        # The .env ships next to the executable (it is not embedded)
+        env_paths = [os.path.join(application_path, '.env')]
+    else:
+        # Running as a normal Python script
+        application_path = os.path.dirname(os.path.abspath(__file__))
+        _dbg(f"[DEBUG] Running as script from: {application_path}")
+        env_paths = [os.path.join(application_path, '.env')]
+
+    for env_path in env_paths:
+        _dbg(f"[DEBUG] Looking for .env at: {env_path}")
+        try:
+            values = dotenv_values(env_path)
+        except OSError:
+            continue
+        if values:
+            for key, value in values.items():
+                if value is not None:
+                    os.environ.setdefault(key, value)
+            _dbg(f"[DEBUG] Loaded .env from: {env_path}")
+            return values
+
+    _dbg(f"[DEBUG] WARNING: No .env file found in any location!")
+    return {}
+
+
+# Merge .env values into os.environ (setdefault: exported variables win)
+_load_env()
+
+
+def _getenv(name: str, default: str = None) -> str:
+    """Read a setting from os.environ, already merged with the .env file.
+
+    Variables exported in the process environment take precedence over
+    the .env file, matching load_dotenv's default behavior."""
+    return os.getenv(name, default)
 
 
 class Config:
     """Configuration class for NewsAPI.org and ZAI settings."""
-    
+
     # NewsAPI Configuration
-    NEWS_API_KEY = os.getenv("NEWS_API_KEY")
-    NEWS_API_BASE = os.getenv("NEWS_API_BASE", "https://newsapi.org/v2")
-    
+    NEWS_API_KEY = _getenv("NEWS_API_KEY")
+    NEWS_API_BASE = _getenv("NEWS_API_BASE", "https://newsapi.org/v2")
+
     # ZAI GLM API Configuration
-    ZAI_API_KEY = os.getenv("ZAI_API_KEY")
-    ZAI_API_BASE = os.getenv("ZAI_API_BASE", "https://api.z.ai/api/paas/v4")
-    ZAI_MODEL = os.getenv("ZAI_MODEL", "glm-4.7")
-    
+    ZAI_API_KEY = _getenv("ZAI_API_KEY")
+    ZAI_API_BASE = _getenv("ZAI_API_BASE", "https://api.z.ai/api/paas/v4")
+    ZAI_MODEL = _getenv("ZAI_MODEL", "glm-4.7")
+
     # Replicate API Configuration
-    REPLICATE_API_TOKEN = os.getenv("REPLICATE_API_TOKEN")
-    
+    REPLICATE_API_TOKEN = _getenv("REPLICATE_API_TOKEN")
+
     # Request settings
     REQUEST_TIMEOUT = 120  # seconds
-    
+
+    # Separate budget for the TCP/TLS connect phase so a dead host or
+    # DNS entry surfaces in seconds, not after the full read timeout
+    CONNECT_TIMEOUT = float(_getenv("CONNECT_TIMEOUT", "2"))  # seconds
+
+    # How long search responses may be served from the in-process cache
+    NEWS_CACHE_TTL = int(_getenv("NEWS_CACHE_TTL", "600"))  # seconds
+
+    # Delay before a duplicate, hedged copy of a NewsAPI request is
+    # fired; adapts to observed latency once enough samples exist
+    NEWS_HEDGE_TIMEOUT = float(_getenv("NEWS_HEDGE_TIMEOUT", "1.5"))  # seconds
+
+    # Articles per classification request; larger sets are split into
+    # batches of this size and classified concurrently
+    ZAI_BATCH_SIZE = int(_getenv("ZAI_BATCH_SIZE", "20"))
+
+    # How long classification/post results may be served from cache
+    ZAI_CACHE_TTL = int(_getenv("ZAI_CACHE_TTL", "1800"))  # seconds
+
+    # Opt-in: classify and generate the post in a single chat call
+    # (see ZAIClassifier.classify_and_post)
+    ZAI_COMBINED_PIPELINE = _getenv("ZAI_COMBINED_PIPELINE", "0") == "1"
+
     @classmethod
     def validate(cls):
-        """Validate that required configuration is present."""
-        if not cls.NEWS_API_KEY:
-            raise ValueError("NEWS_API_KEY is not set in environment variables")
-        return True
+        """Validate that required configuration is present (cached)."""
+        return _validated()
+
+
+@functools.lru_cache(maxsize=1)
+def _validated() -> bool:
+    """Run the configuration checks once; later calls reuse the result."""
+    if not Config.NEWS_API_KEY:
+        raise ValueError("NEWS_API_KEY is not set in environment variables")
+    return True
@@ -3,23 +3,36 @@ Script to create an icon for the NewsAPI Automation executable.
 Run this script to generate the icon.ico file.
 """
 
-from PIL import Image, ImageDraw, ImageFont
 import os
 
+_HERE = os.path.dirname(os.path.abspath(__file__))
+ICON_PATH = os.path.join(_HERE, 'icon.ico')
+
 def create_icon():
     """Create a simple icon for the application."""
-    
-    # Create a new image with transparent background
+    # Import here so importing this module doesn't pay PIL's import cost
+    from PIL import Image, ImageDraw
+
+    # Draw in palette mode - the icon only uses 3 colors plus transparency,
+    # so 'P' mode quarters the pixel memory versus RGBA
+    # Palette indices: 0 transparent, 1 LinkedIn blue, 2 white, 3 grey
     size = 256
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    img = Image.new('P', (size, size), 0)
+    img.putpalette([
+        0, 0, 0,        # 0: transparent background
+        10, 102, 194,   # 1: #0a66c2
+        255, 255, 255,  # 2: white
+        204, 204, 204,  # 3: #cccccc
+    ])
+    img.info['transparency'] = 0
     draw = ImageDraw.Draw(img)
-    
+
     # Draw a blue circle background (LinkedIn-like color)
     center = size // 2
     radius = size // 2 - 10
     draw.ellipse([center - radius, center - radius, center + radius, center + radius],
-                 fill='#0a66c2')
-    
+                 fill=1)
+
     # Draw a newspaper icon (white)
     # Main rectangle
     paper_left = center - 60
@@ -27,27 +40,33 @@ def create_icon():
     paper_right = center + 60
     paper_bottom = center + 70
     draw.rectangle([paper_left, paper_top, paper_right, paper_bottom],
-                   fill='white', outline='white', width=2)
+                   fill=2, outline=2, width=2)
     
-    # Draw text lines
+    # Draw text lines (title line is longer, body lines shorter)
     line_height = 12
     line_spacing = 8
     start_y = paper_top + 20
+    lines = []
     for i in range(6):
         y = start_y + i * (line_height + line_spacing)
         if i == 0:
-            # Title line (longer)
-            draw.rectangle([paper_left + 15, y, paper_right - 15, y + line_height],
-                          fill='#0a66c2')
+            lines.append(([paper_left + 15, y, paper_right - 15, y + line_height], 1))
         else:
-            # Body lines (shorter)
-            draw.rectangle([paper_left + 15, y, paper_right - 30, y + line_height],
-                          fill='#cccccc')
-    
-    # Save as .ico file with multiple sizes
+            lines.append(([paper_left + 15, y, paper_right - 30, y + line_height], 3))
+    for xy, fill in lines:
+        draw.rectangle(xy, fill=fill)
+
+    # Convert back to RGBA (applying the transparency index) for the
+    # high-quality resize and the ICO writer
+    img = img.convert('RGBA')
+
+    # Save as .ico file with multiple sizes, pre-resizing each entry once
+    # instead of letting the ICO writer resample from the source per entry
     icon_sizes = [(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)]
-    icon_path = os.path.join(os.path.dirname(__file__), 'icon.ico')
-    img.save(icon_path, format='ICO', sizes=icon_sizes)
+    icon_path = ICON_PATH
+    pyramid = [img.resize(s, Image.Resampling.LANCZOS) for s in icon_sizes]
+    pyramid[-1].save(icon_path, format='ICO', sizes=icon_sizes,
+                     append_images=pyramid[:-1])
     
     print(f"✓ Icon created: {icon_path}")
     return icon_path
@@ -3,16 +3,19 @@ NewsAPI Automation App - GUI Version (Componentized)
 A visual Python app that searches NewsAPI.org using comma-separated terms.
 """
 
+import os
 import tkinter as tk
-from tkinter import ttk, messagebox
-from threading import Thread
+from tkinter import ttk
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 from gui_styles import GUIStyles
-from gui_components import HeaderComponent, InputComponent, ResultsComponent, LinkedInModal
-from tuning_search import NewsAPIClient
-from zai_classifier import ZAIClassifier
-from image_generator import ImageGenerator
+
+# Debug prints are off unless NEWSAPI_DEBUG is set in the environment
+_dbg = print if os.getenv("NEWSAPI_DEBUG") else (lambda *args, **kwargs: None)
+
+# Heavy modules (requests, PIL, API clients) are imported lazily inside the
+# methods that need them so the Tk window paints before they load.
 
 
 class NewsAPIGUI:
@@ -39,9 +42,14 @@ class NewsAPIGUI:
         self.api_connected = False
         self.api_error = None
         self._init_client()
-        self.classifier = ZAIClassifier()
-        self.image_generator = ImageGenerator()
-        
+        self._classifier = None
+        self._image_generator = None
+
+        # Shared worker pool for all background API work
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='newsapi')
+        self._current_future = None
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
         # Initialize components
         self.header = None
         self.input_component = None
@@ -49,21 +57,49 @@ class NewsAPIGUI:
         
         # Build UI
         self._build_ui()
-        
+
+        # Cache hot widget references so status/button updates skip the
+        # component attribute lookups
+        self._set_status = self.input_component.set_status
+        self._classify_btn = self.results_component.classify_button
+        self._abort_btn = self.results_component.abort_button
+        self._generate_post_btn = self.results_component.generate_post_button
+        self._generate_image_btn = self.results_component.generate_image_button
+        self._show_modal_btn = self.results_component.show_modal_button
+
         # Show API status
         self._show_api_status()
     
     def _init_client(self) -> None:
         """Initialize the NewsAPI client."""
         try:
-            self.client = NewsAPIClient()
+            from tuning_search import get_newsapi_client
+            self.client = get_newsapi_client()
             self.api_connected = True
         except ValueError as e:
             self.api_connected = False
             self.api_error = str(e)
-    
+
+    @property
+    def classifier(self):
+        """Lazily construct the ZAI classifier on first access."""
+        if self._classifier is None:
+            from zai_classifier import get_zai_classifier
+            self._classifier = get_zai_classifier()
+        return self._classifier
+
+    @property
+    def image_generator(self):
+        """Lazily construct the image generator on first access."""
+        if self._image_generator is None:
+            from image_generator import ImageGenerator
+            self._image_generator = ImageGenerator()
+        return self._image_generator
+
     def _build_ui(self) -> None:
         """Build the user interface."""
+        from gui_components import HeaderComponent, InputComponent, ResultsComponent
+
         # Header component
         self.header = HeaderComponent(self.root, self.styles)
         self.header.pack(fill='x', padx=0, pady=0)
@@ -94,9 +130,10 @@ class NewsAPIGUI:
     def _show_api_status(self) -> None:
         """Show API connection status."""
         if self.api_connected:
-            self.input_component.set_status("✓ API Connected", 'green')
+            self._set_status("✓ API Connected", 'green')
         else:
-            self.input_component.set_status("✗ API Error: Check .env file", 'red')
+            self._set_status("✗ API Error: Check .env file", 'red')
+            from tkinter import messagebox
             messagebox.showerror("Configuration Error",
                                f"API Configuration Error:\n{self.api_error}")
     
@@ -105,19 +142,18 @@ class NewsAPIGUI:
         search_terms = self.input_component.get_search_terms()
         
         if not search_terms:
+            from tkinter import messagebox
             messagebox.showwarning("Input Required",
                                  "Please enter at least one search term.")
             return
         
         # Disable button and show searching status
         self.input_component.set_search_button_state('disabled')
-        self.input_component.set_status("Searching...", 'blue')
+        self._set_status("Searching...", 'blue')
         self.results_component.clear()
         
-        # Run search in separate thread to avoid freezing UI
-        thread = Thread(target=self._perform_search, args=(search_terms,))
-        thread.daemon = True
-        thread.start()
+        # Run search on the worker pool to avoid freezing UI
+        self._current_future = self._pool.submit(self._perform_search, search_terms)
     
     def _perform_search(self, search_terms: List[str]) -> None:
         """
@@ -129,25 +165,30 @@ class NewsAPIGUI:
         try:
             mode = self.input_component.get_search_mode()
             page_size = self.input_component.get_page_size()
-            results = self.client.search_multiple(search_terms, mode=mode, pageSize=page_size)
-            
-            # Update UI from main thread
-            self.root.after(0, lambda: self._display_results(results))
+
+            # Stream each result to the UI as its query resolves instead of
+            # waiting for the whole batch
+            self.root.after(0, self.results_component.begin_results)
+            count = 0
+            for result in self.client.iter_search(search_terms, mode=mode, pageSize=page_size):
+                count += 1
+                self.root.after(0, self.results_component.append_results, [result])
+            self.root.after(0, self._finish_search, count)
         except Exception as e:
-            self.root.after(0, lambda: self._display_error(str(e)))
-    
-    def _display_results(self, results: List[dict]) -> None:
+            self.root.after(0, self._display_error, str(e))
+
+    def _finish_search(self, count: int) -> None:
         """
-        Display search results.
-        
+        Finalize the results display after all queries have resolved.
+
         Args:
-            results: List of search result dictionaries
+            count: Number of search results received
         """
-        self.results_component.display_results(results)
-        
+        self.results_component.finish_results()
+
         # Re-enable button and update status
         self.input_component.set_search_button_state('normal')
-        self.input_component.set_status(f"✓ Found {len(results)} result(s)", 'green')
+        self._set_status(f"✓ Found {count} result(s)", 'green')
     
     def _display_error(self, error_msg: str) -> None:
         """
@@ -158,32 +199,35 @@ class NewsAPIGUI:
         """
         self.results_component.display_error(error_msg)
         self.input_component.set_search_button_state('normal')
-        self.input_component.set_status("✗ Error occurred", 'red')
+        self._set_status("✗ Error occurred", 'red')
     
-    def on_clear(self) -> None:
-        """Handle clear button click."""
+    def _reset_ui(self) -> None:
+        """Clear input and results and return to the initial search state."""
         self.input_component.clear()
         self.results_component.clear()
         self.results_component.reset_to_search_state()
-        self.input_component.set_status("Ready", 'black')
+        self._set_status("Ready", 'black')
+
+    def on_clear(self) -> None:
+        """Handle clear button click."""
+        self._reset_ui()
     
     def on_generate_direct_post(self) -> None:
         """Handle generate direct post button click."""
         input_text = self.input_component.get_input_text()
         
         if not input_text:
+            from tkinter import messagebox
             messagebox.showwarning("Input Required",
                                  "Please enter text for the post.")
             return
         
         # Disable button and show generating status
         self.input_component.generate_direct_post_button.config(state='disabled')
-        self.input_component.set_status("Generating LinkedIn post...", 'blue')
+        self._set_status("Generating LinkedIn post...", 'blue')
         
-        # Run post generation in separate thread to avoid freezing UI
-        thread = Thread(target=self._perform_direct_post_generation, args=(input_text,))
-        thread.daemon = True
-        thread.start()
+        # Run post generation on the worker pool to avoid freezing UI
+        self._current_future = self._pool.submit(self._perform_direct_post_generation, input_text)
     
     def on_classify(self, articles: List[dict]) -> None:
         """
@@ -193,13 +237,11 @@ class NewsAPIGUI:
             articles: List of article dictionaries to classify
         """
         # Disable classify button and show classifying status
-        self.results_component.classify_button.config(state='disabled')
-        self.input_component.set_status("Classifying with GLM...", 'blue')
+        self._classify_btn.config(state='disabled')
+        self._set_status("Classifying with GLM...", 'blue')
         
-        # Run classification in separate thread to avoid freezing UI
-        thread = Thread(target=self._perform_classification, args=(articles,))
-        thread.daemon = True
-        thread.start()
+        # Run classification on the worker pool to avoid freezing UI
+        self._current_future = self._pool.submit(self._perform_classification, articles)
     
     def _perform_classification(self, articles: List[dict]) -> None:
         """
@@ -210,13 +252,13 @@ class NewsAPIGUI:
         """
         try:
             classification = self.classifier.classify_news(articles)
-            print(f"DEBUG: Classification result: {classification[:200] if classification else 'None'}")
+            _dbg(f"DEBUG: Classification result: {classification[:200] if classification else 'None'}")
             
             # Update UI from main thread
-            self.root.after(0, lambda: self._display_classification(classification))
+            self.root.after(0, self._display_classification, classification)
         except Exception as e:
-            print(f"DEBUG: Classification error: {str(e)}")
-            self.root.after(0, lambda: self._display_classification_error(str(e)))
+            _dbg(f"DEBUG: Classification error: {str(e)}")
+            self.root.after(0, self._display_classification_error, str(e))
     
     def _display_classification(self, classification: str) -> None:
         """
@@ -228,8 +270,8 @@ class NewsAPIGUI:
         self.results_component.display_classification(classification)
         
         # Re-enable button and update status
-        self.results_component.classify_button.config(state='normal')
-        self.input_component.set_status("✓ Classification complete", 'green')
+        self._classify_btn.config(state='normal')
+        self._set_status("✓ Classification complete", 'green')
     
     def _display_classification_error(self, error_msg: str) -> None:
         """
@@ -239,15 +281,16 @@ class NewsAPIGUI:
             error_msg: The error message
         """
         self.results_component.display_error(f"Classification error: {error_msg}")
-        self.results_component.classify_button.config(state='normal')
-        self.input_component.set_status("✗ Classification error", 'red')
+        self._classify_btn.config(state='normal')
+        self._set_status("✗ Classification error", 'red')
     
     def on_abort(self) -> None:
         """Handle abort button click - clears everything and returns to search."""
-        self.input_component.clear()
-        self.results_component.clear()
-        self.results_component.reset_to_search_state()
-        self.input_component.set_status("Ready", 'black')
+        # Cancel in-flight work if it hasn't started yet
+        if self._current_future is not None:
+            self._current_future.cancel()
+            self._current_future = None
+        self._reset_ui()
     
     def on_select_article(self, article: dict) -> None:
         """
@@ -261,13 +304,11 @@ class NewsAPIGUI:
         
         # Disable buttons and show generating status
         self.results_component.generate_selected_post_button.config(state='disabled')
-        self.results_component.abort_button.config(state='disabled')
-        self.input_component.set_status("Generating LinkedIn post...", 'blue')
+        self._abort_btn.config(state='disabled')
+        self._set_status("Generating LinkedIn post...", 'blue')
         
-        # Run post generation in separate thread to avoid freezing UI
-        thread = Thread(target=self._perform_article_post_generation, args=(article, comment))
-        thread.daemon = True
-        thread.start()
+        # Run post generation on the worker pool to avoid freezing UI
+        self._current_future = self._pool.submit(self._perform_article_post_generation, article, comment)
     
     def on_generate_post(self, classification: str) -> None:
         """
@@ -277,14 +318,12 @@ class NewsAPIGUI:
             classification: The classification result text
         """
         # Disable buttons and show generating status
-        self.results_component.generate_post_button.config(state='disabled')
-        self.results_component.abort_button.config(state='disabled')
-        self.input_component.set_status("Generating LinkedIn post...", 'blue')
-        
-        # Run post generation in separate thread to avoid freezing UI
-        thread = Thread(target=self._perform_post_generation, args=(classification,))
-        thread.daemon = True
-        thread.start()
+        self._generate_post_btn.config(state='disabled')
+        self._abort_btn.config(state='disabled')
+        self._set_status("Generating LinkedIn post...", 'blue')
+        
+        # Run post generation on the worker pool to avoid freezing UI
+        self._current_future = self._pool.submit(self._perform_post_generation, classification)
     
     def _perform_article_post_generation(self, article: dict, comment: str = "") -> None:
         """
@@ -296,13 +335,13 @@ class NewsAPIGUI:
         """
         try:
             post = self.classifier.generate_linkedin_post_from_article(article, comment)
-            print(f"DEBUG: Generated post from article: {post[:200] if post else 'None'}")
+            _dbg(f"DEBUG: Generated post from article: {post[:200] if post else 'None'}")
             
             # Update UI from main thread
-            self.root.after(0, lambda: self._display_generated_post(post))
+            self.root.after(0, self._display_generated_post, post)
         except Exception as e:
-            print(f"DEBUG: Post generation error: {str(e)}")
-            self.root.after(0, lambda: self._display_post_generation_error(str(e)))
+            _dbg(f"DEBUG: Post generation error: {str(e)}")
+            self.root.after(0, self._display_post_generation_error, str(e))
     
     def _perform_post_generation(self, classification: str) -> None:
         """
@@ -313,13 +352,13 @@ class NewsAPIGUI:
         """
         try:
             post = self.classifier.generate_linkedin_post(classification)
-            print(f"DEBUG: Generated post: {post[:200] if post else 'None'}")
+            _dbg(f"DEBUG: Generated post: {post[:200] if post else 'None'}")
             
             # Update UI from main thread
-            self.root.after(0, lambda: self._display_generated_post(post))
+            self.root.after(0, self._display_generated_post, post)
         except Exception as e:
-            print(f"DEBUG: Post generation error: {str(e)}")
-            self.root.after(0, lambda: self._display_post_generation_error(str(e)))
+            _dbg(f"DEBUG: Post generation error: {str(e)}")
+            self.root.after(0, self._display_post_generation_error, str(e))
     
     def _perform_direct_post_generation(self, input_text: str) -> None:
         """
@@ -330,23 +369,20 @@ class NewsAPIGUI:
         """
         try:
             post = self.classifier.generate_linkedin_post_direct(input_text)
-            print(f"DEBUG: Generated post from input: {post[:200] if post else 'None'}")
+            _dbg(f"DEBUG: Generated post from input: {post[:200] if post else 'None'}")
             
             # Update UI from main thread
-            self.root.after(0, lambda: self._display_generated_post(post))
-            
-            # Re-enable the direct post button
-            def enable_direct_post_button():
-                self.input_component.generate_direct_post_button.config(state='normal')
-            self.root.after(500, enable_direct_post_button)
+            self.root.after(0, self._display_generated_post, post)
         except Exception as e:
-            print(f"DEBUG: Post generation error: {str(e)}")
-            self.root.after(0, lambda: self._display_post_generation_error(str(e)))
-            
-            # Re-enable the direct post button on error
-            def enable_direct_post_button():
-                self.input_component.generate_direct_post_button.config(state='normal')
-            self.root.after(500, enable_direct_post_button)
+            _dbg(f"DEBUG: Post generation error: {str(e)}")
+            self.root.after(0, self._display_post_generation_error, str(e))
+        finally:
+            # Re-enable the direct post button on success or error
+            self.root.after(500, self._enable_direct_post_button)
+
+    def _enable_direct_post_button(self) -> None:
+        """Re-enable the direct post button."""
+        self.input_component.generate_direct_post_button.config(state='normal')
     
     def _display_generated_post(self, post: str) -> None:
         """
@@ -358,8 +394,8 @@ class NewsAPIGUI:
         self.results_component.display_generated_post(post)
         
         # Re-enable abort button and update status
-        self.results_component.abort_button.config(state='normal')
-        self.input_component.set_status("✓ LinkedIn post generated", 'green')
+        self._abort_btn.config(state='normal')
+        self._set_status("✓ LinkedIn post generated", 'green')
     
     def on_generate_image(self, post: str) -> None:
         """
@@ -369,14 +405,12 @@ class NewsAPIGUI:
             post: The generated LinkedIn post text
         """
         # Disable buttons and show generating status
-        self.results_component.generate_image_button.config(state='disabled')
-        self.results_component.abort_button.config(state='disabled')
-        self.input_component.set_status("Generating image...", 'blue')
-        
-        # Run image generation in separate thread to avoid freezing UI
-        thread = Thread(target=self._perform_image_generation, args=(post,))
-        thread.daemon = True
-        thread.start()
+        self._generate_image_btn.config(state='disabled')
+        self._abort_btn.config(state='disabled')
+        self._set_status("Generating image...", 'blue')
+        
+        # Run image generation on the worker pool to avoid freezing UI
+        self._current_future = self._pool.submit(self._perform_image_generation, post)
     
     def _perform_image_generation(self, post: str) -> None:
         """
@@ -387,19 +421,19 @@ class NewsAPIGUI:
         """
         try:
             result = self.image_generator.generate_image(post)
-            print(f"DEBUG: Image generation result: {result}")
+            _dbg(f"DEBUG: Image generation result: {result}")
             
             # Update UI from main thread
-            self.root.after(0, lambda: self._display_generated_image(result))
+            self.root.after(0, self._display_generated_image, result)
             
             # After a short delay, enable the modal button
             def enable_modal_button():
                 if result and result.startswith("images\\"):
-                    self.results_component.show_modal_button.config(state='normal')
+                    self._show_modal_btn.config(state='normal')
             self.root.after(2000, enable_modal_button)
         except Exception as e:
-            print(f"DEBUG: Image generation error: {str(e)}")
-            self.root.after(0, lambda: self._display_image_generation_error(str(e)))
+            _dbg(f"DEBUG: Image generation error: {str(e)}")
+            self.root.after(0, self._display_image_generation_error, str(e))
     
     def _display_generated_image(self, result: str) -> None:
         """
@@ -419,8 +453,8 @@ class NewsAPIGUI:
         self.results_component.display_generated_image(image_url, local_image_path)
         
         # Re-enable abort button and update status
-        self.results_component.abort_button.config(state='normal')
-        self.input_component.set_status("✓ Image generated", 'green')
+        self._abort_btn.config(state='normal')
+        self._set_status("✓ Image generated", 'green')
     
     def _display_image_generation_error(self, error_msg: str) -> None:
         """
@@ -430,9 +464,9 @@ class NewsAPIGUI:
             error_msg: The error message
         """
         self.results_component.display_error(f"Image generation error: {error_msg}")
-        self.results_component.abort_button.config(state='normal')
-        self.results_component.generate_image_button.config(state='normal')
-        self.input_component.set_status("✗ Image generation error", 'red')
+        self._abort_btn.config(state='normal')
+        self._generate_image_btn.config(state='normal')
+        self._set_status("✗ Image generation error", 'red')
     
     def on_show_modal(self, post: str, image_url: str, local_image_path: str = None) -> None:
         """
@@ -443,6 +477,7 @@ class NewsAPIGUI:
             image_url: The generated image URL
             local_image_path: Local path to the downloaded image
         """
+        from gui_components import LinkedInModal
         modal = LinkedInModal(self.root, self.styles, post, image_url, local_image_path)
     
     def _display_post_generation_error(self, error_msg: str) -> None:
@@ -453,9 +488,14 @@ class NewsAPIGUI:
             error_msg: The error message
         """
         self.results_component.display_error(f"Post generation error: {error_msg}")
-        self.results_component.abort_button.config(state='normal')
-        self.results_component.generate_post_button.config(state='normal')
-        self.input_component.set_status("✗ Post generation error", 'red')
+        self._abort_btn.config(state='normal')
+        self._generate_post_btn.config(state='normal')
+        self._set_status("✗ Post generation error", 'red')
+
+    def _on_close(self) -> None:
+        """Handle window close - shut down the worker pool."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
 
 
 def main() -> None:
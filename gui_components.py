@@ -3,12 +3,48 @@ GUI Components Module
 Contains individual GUI components for the NewsAPI application.
 """
 
+import hashlib
+import os
+import subprocess
+import sys
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import groupby
+from operator import itemgetter
 from tkinter import ttk, scrolledtext
 from typing import Callable, List
 from gui_styles import GUIStyles
 from PIL import Image, ImageTk
 
+# Debug output is opt-in: stdout writes from a windowed app can block the
+# UI thread on pipe backpressure, so they are a no-op unless requested
+_dbg = print if os.getenv("NEWSAPI_DEBUG") else (lambda *args, **kwargs: None)
+
+# Search-mode descriptions shown next to each result
+_MODE_DESCRIPTIONS = {
+    "everything": "Search all news",
+    "top-headlines": "Top headlines",
+    "sources": "News sources",
+}
+
+# Pre-formatted "description (mode)" labels, built once instead of per result
+_MODE_TAGS = {m: f"{d} ({m})" for m, d in _MODE_DESCRIPTIONS.items()}
+
+# Worker pool for decoding modal preview images off the Tk thread
+_IMAGE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix='modal-img')
+
+# On-disk cache of downscaled modal previews, next to the generated images
+_THUMB_DIR = os.path.join('images', '.thumbs')
+
+# Separator lines reused across every render instead of rebuilt per call
+_SEP80 = "=" * 80 + "\n"
+_SEP40 = "-" * 40 + "\n"
+
+# Article fields kept for the classification pipeline; everything else
+# (full content HTML, media blobs) is dropped after rendering
+_ARTICLE_KEEP_FIELDS = ('title', 'url', 'publishedAt', 'description', 'source')
+
 
 class HeaderComponent:
     """Header component with title and subtitle."""
@@ -174,17 +210,9 @@ class InputComponent:
         input_text = self.search_entry.get().strip()
         if not input_text:
             return []
-        
-        mode = self.mode_var.get()
-        if mode == "sources":
-            # For sources mode, split by commas
-            terms = [term.strip() for term in input_text.split(",")]
-        else:
-            # For everything and top-headlines modes, split by commas
-            terms = [term.strip() for term in input_text.split(",")]
-        
-        terms = [term for term in terms if term]
-        return terms
+
+        # Every mode splits on commas; strip and drop empties in one pass
+        return [s for s in (t.strip() for t in input_text.split(",")) if s]
     
     def get_search_mode(self) -> str:
         """
@@ -278,10 +306,15 @@ class ResultsComponent:
         self.generate_image_button = None
         self.show_modal_button = None
         self.current_articles = []
+        self._max_articles = 200  # keep memory bounded across searches
         self.current_classification = ""
         self.current_post = ""
         self.current_image_url = ""
         self.current_local_image_path = ""
+        self._result_count = 0
+        self._pending_chunks = []
+        self._render_queue = []
+        self._pending_see = False
         self._build()
     
     def _build(self) -> None:
@@ -297,33 +330,29 @@ class ResultsComponent:
                                         state='disabled')
         self.classify_button.pack(side='right')
         
+        # Action buttons start unpacked; 'hidden' is not a valid ttk
+        # state, so visibility is handled with pack/pack_forget instead
+        self._action_pack = dict(side='right', padx=(0, 10))
+
         # Abort button (initially hidden)
         self.abort_button = ttk.Button(self.button_frame, text="❌ Abortar",
                                        style='Danger.TButton',
-                                       command=self._on_abort,
-                                       state='hidden')
-        self.abort_button.pack(side='right', padx=(0, 10))
+                                       command=self._on_abort)
         
         # Generate post button (initially hidden)
         self.generate_post_button = ttk.Button(self.button_frame, text="📝 Gerar Notícia",
                                                 style='Secondary.TButton',
-                                                command=self._on_generate_post,
-                                                state='hidden')
-        self.generate_post_button.pack(side='right', padx=(0, 10))
+                                                command=self._on_generate_post)
         
         # Generate image button (initially hidden)
         self.generate_image_button = ttk.Button(self.button_frame, text="🖼️ Gerar Imagem",
                                                   style='Secondary.TButton',
-                                                  command=self._on_generate_image,
-                                                  state='hidden')
-        self.generate_image_button.pack(side='right', padx=(0, 10))
+                                                  command=self._on_generate_image)
         
         # Show modal button (initially hidden)
         self.show_modal_button = ttk.Button(self.button_frame, text="👁️ Mostrar no Modal",
                                               style='Primary.TButton',
-                                              command=self._on_show_modal,
-                                              state='hidden')
-        self.show_modal_button.pack(side='right', padx=(0, 10))
+                                              command=self._on_show_modal)
         
         # Results text area
         self.results_text = scrolledtext.ScrolledText(self.frame,
@@ -343,104 +372,230 @@ class ResultsComponent:
     def pack(self, **kwargs) -> None:
         """Pack the frame."""
         self.frame.pack(**kwargs)
-    
+
+    def _show(self, button: ttk.Button) -> None:
+        """Make an action button visible (idempotent)."""
+        if not button.winfo_ismapped():
+            button.pack(**self._action_pack)
+
+    @staticmethod
+    def _hide(button: ttk.Button) -> None:
+        """Remove an action button from the layout."""
+        button.pack_forget()
+
     def clear(self) -> None:
         """Clear the results text area."""
+        self._pending_chunks = []
+        self._render_queue = []
+        self._pending_see = False
         self.results_text.delete(1.0, tk.END)
-    
+
     def append_text(self, text: str, tag: str = None) -> None:
         """
-        Append text to the results area.
-        
+        Queue text for the results area; written on the next flush().
+
         Args:
             text: The text to append
             tag: Optional tag for styling
         """
-        if tag:
-            self.results_text.insert(tk.END, text, tag)
-        else:
-            self.results_text.insert(tk.END, text)
-    
-    def display_results(self, results: List[dict]) -> None:
+        self._pending_chunks.append((text, tag))
+
+    def flush(self) -> None:
+        """Write all queued text with a single insert, then tag the ranges."""
+        chunks = self._pending_chunks
+        if not chunks:
+            return
+        self._pending_chunks = []
+
+        # Merge consecutive same-tag chunks first so each styled run is a
+        # single segment in the Text widget's B-tree, then walk the merged
+        # runs once to turn tag positions into line.col spans relative to
+        # the current end of the widget
+        runs = [("".join(t for t, _ in group), tag)
+                for tag, group in groupby(chunks, key=itemgetter(1))]
+
+        line, col = map(int, self.results_text.index('end-1c').split('.'))
+        spans = []
+        for text, tag in runs:
+            newlines = text.count('\n')
+            if newlines:
+                end_line = line + newlines
+                end_col = len(text) - text.rfind('\n') - 1
+            else:
+                end_line = line
+                end_col = col + len(text)
+            if tag:
+                spans.append((tag, f"{line}.{col}", f"{end_line}.{end_col}"))
+            line, col = end_line, end_col
+
+        self.results_text.insert(tk.END, "".join(text for text, _ in runs))
+        for tag, start, end in spans:
+            self.results_text.tag_add(tag, start, end)
+
+    @contextmanager
+    def _frozen_text(self):
+        """Detach the scrollbar during a bulk write to skip per-insert
+        geometry recomputation, then scroll to the end on exit."""
+        yscroll = self.results_text.cget('yscrollcommand')
+        self.results_text.configure(yscrollcommand='')
+        try:
+            yield
+        finally:
+            self.results_text.configure(yscrollcommand=yscroll)
+            self._schedule_see_end()
+
+    def _schedule_see_end(self) -> None:
+        """Request a scroll to the end of the text, coalescing repeated
+        requests into a single callback per event-loop turn."""
+        if not self._pending_see:
+            self._pending_see = True
+            self.frame.after_idle(self._do_see_end)
+
+    def _do_see_end(self) -> None:
+        """Run the deferred scroll-to-end."""
+        self._pending_see = False
+        try:
+            self.results_text.see(tk.END)
+        except tk.TclError:
+            pass
+
+    def begin_results(self) -> None:
+        """Clear the display and write the results header."""
+        self.clear()
+        self.current_articles = []
+        self._result_count = 0
+        self.append_text(_SEP80, 'header')
+        self.append_text("NEWSAPI.ORG RESULTS\n", 'header')
+        self.append_text(_SEP80 + "\n", 'header')
+
+    def append_results(self, results: List[dict]) -> None:
         """
-        Display search results in the text area.
-        
+        Append a batch of search results to the display.
+
         Args:
             results: List of search result dictionaries
         """
-        self.clear()
-        self.current_articles = []
-        
-        # Header
-        self.append_text("=" * 80 + "\n", 'header')
-        self.append_text("NEWSAPI.ORG RESULTS\n", 'header')
-        self.append_text("=" * 80 + "\n\n", 'header')
-        
-        for i, result in enumerate(results, 1):
-            if "error" in result:
-                mode = result.get('mode', 'everything')
-                mode_desc = self._get_mode_description(mode)
-                self.append_text(f"[{i}] Query: {result.get('query', 'Unknown')}\n", 'query')
-                self.append_text(f"    Mode: {mode_desc} ({mode})\n")
-                self.append_text(f"    Status: FAILED - {result['error']}\n\n", 'error')
-            elif result.get("status") == "ok":
-                mode = result.get('mode', 'everything')
-                query = result.get('query', 'Unknown')
-                mode_desc = self._get_mode_description(mode)
-                self.append_text(f"[{i}] Query: {query}\n", 'query')
-                self.append_text(f"    Mode: {mode_desc} ({mode})\n")
-                self.append_text("-" * 40 + "\n", 'separator')
-                
-                # Display total results
-                total_results = result.get("totalResults", 0)
-                self.append_text(f"    Total Results: {total_results}\n\n")
-                
-                # Display articles or sources
-                if mode == "sources":
-                    if "sources" in result:
-                        for j, source in enumerate(result["sources"], 1):
-                            self.append_text(f"    Source {j}:\n")
-                            self.append_text(f"        ID: {source.get('id', 'N/A')}\n")
-                            self.append_text(f"        Name: {source.get('name', 'N/A')}\n")
-                            description = source.get('description') or 'N/A'
-                            if description != 'N/A' and len(description) > 150:
-                                description = description[:150] + "..."
-                            self.append_text(f"        Description: {description}\n")
-                            self.append_text(f"        Category: {source.get('category', 'N/A')}\n")
-                            self.append_text(f"        Language: {source.get('language', 'N/A')}\n")
-                            self.append_text(f"        Country: {source.get('country', 'N/A')}\n")
-                            self.append_text("\n")
-                else:
-                    if "articles" in result:
-                        for j, article in enumerate(result["articles"], 1):
-                            self.append_text(f"    Article {j}:\n")
-                            self.append_text(f"        Title: {article.get('title', 'N/A')}\n")
-                            self.append_text(f"        Source: {article.get('source', {}).get('name', 'N/A')}\n")
-                            self.append_text(f"        Author: {article.get('author', 'N/A')}\n")
-                            self.append_text(f"        URL: {article.get('url', 'N/A')}\n")
-                            self.append_text(f"        Published: {article.get('publishedAt', 'N/A')}\n")
-                            description = article.get('description') or 'N/A'
-                            if description != 'N/A' and len(description) > 200:
-                                description = description[:200] + "..."
-                            self.append_text(f"        Description: {description}\n")
-                            self.append_text("\n")
-                            # Store article for classification
-                            self.current_articles.append(article)
-                            
-            else:
-                # Handle unexpected response format
-                self.append_text(f"[{i}] Query: {result.get('query', 'Unknown')}\n", 'query')
-                self.append_text(f"    Status: Unexpected response format\n", 'error')
-                self.append_text(f"    Response: {result}\n\n")
-        
-        self.append_text("=" * 80 + "\n", 'header')
-        
+        for result in results:
+            self._result_count += 1
+            self._render_result(self._result_count, result)
+        self.flush()
+
+    def finish_results(self) -> None:
+        """Write the results footer and update the classify button state."""
+        self.append_text(_SEP80, 'header')
+        self.flush()
+
         # Enable classify button if there are articles
         if self.current_articles and self.on_classify:
             self.classify_button.config(state='normal')
         else:
             self.classify_button.config(state='disabled')
-    
+
+    # Results rendered per idle-loop tick; keeps the first screenful fast
+    # while the rest of a large batch fills in behind it
+    RENDER_BATCH = 5
+
+    def display_results(self, results: List[dict]) -> None:
+        """
+        Display search results in the text area.
+
+        Large batches are rendered progressively: the first few results are
+        drawn immediately and the remainder drains on after_idle ticks, so
+        the visible portion paints without waiting for the whole set.
+
+        Args:
+            results: List of search result dictionaries
+        """
+        self.begin_results()
+        self._render_queue = list(results)
+        self._drain_render_queue()
+
+    def _drain_render_queue(self) -> None:
+        """Render the next batch of queued results, rescheduling if more remain."""
+        batch = self._render_queue[:self.RENDER_BATCH]
+        del self._render_queue[:self.RENDER_BATCH]
+        self.append_results(batch)
+        if self._render_queue:
+            self.results_text.after_idle(self._drain_render_queue)
+        else:
+            self.finish_results()
+
+    @staticmethod
+    def _trunc(s: str, n: int, placeholder: str = 'N/A') -> str:
+        """Truncate a string to n characters, or return the placeholder
+        when it is empty/missing."""
+        if not s:
+            return placeholder
+        return s if len(s) <= n else s[:n] + '...'
+
+    def _render_result(self, i: int, result: dict) -> None:
+        """
+        Render a single search result into the text area.
+
+        Args:
+            i: The 1-based result number
+            result: The search result dictionary
+        """
+        if "error" in result:
+            mode = result.get('mode', 'everything')
+            mode_tag = _MODE_TAGS.get(mode) or f"Unknown mode ({mode})"
+            self.append_text(f"[{i}] Query: {result.get('query', 'Unknown')}\n", 'query')
+            self.append_text(f"    Mode: {mode_tag}\n")
+            self.append_text(f"    Status: FAILED - {result['error']}\n\n", 'error')
+        elif result.get("status") == "ok":
+            mode = result.get('mode', 'everything')
+            query = result.get('query', 'Unknown')
+            mode_tag = _MODE_TAGS.get(mode) or f"Unknown mode ({mode})"
+            self.append_text(f"[{i}] Query: {query}\n", 'query')
+            self.append_text(f"    Mode: {mode_tag}\n")
+            self.append_text(_SEP40, 'separator')
+
+            # Display total results
+            total_results = result.get("totalResults", 0)
+            self.append_text(f"    Total Results: {total_results}\n\n")
+
+            # Display articles or sources
+            if mode == "sources":
+                if "sources" in result:
+                    for j, source in enumerate(result["sources"], 1):
+                        description = self._trunc(source.get('description'), 150)
+                        # One string per source block instead of a call per field
+                        self.append_text(
+                            f"    Source {j}:\n"
+                            f"        ID: {source.get('id', 'N/A')}\n"
+                            f"        Name: {source.get('name', 'N/A')}\n"
+                            f"        Description: {description}\n"
+                            f"        Category: {source.get('category', 'N/A')}\n"
+                            f"        Language: {source.get('language', 'N/A')}\n"
+                            f"        Country: {source.get('country', 'N/A')}\n"
+                            "\n"
+                        )
+            else:
+                if "articles" in result:
+                    for j, article in enumerate(result["articles"], 1):
+                        description = self._trunc(article.get('description'), 200)
+                        # One string per article block instead of a call per field
+                        self.append_text(
+                            f"    Article {j}:\n"
+                            f"        Title: {article.get('title', 'N/A')}\n"
+                            f"        Source: {article.get('source', {}).get('name', 'N/A')}\n"
+                            f"        Author: {article.get('author', 'N/A')}\n"
+                            f"        URL: {article.get('url', 'N/A')}\n"
+                            f"        Published: {article.get('publishedAt', 'N/A')}\n"
+                            f"        Description: {description}\n"
+                            "\n"
+                        )
+                        # Store a slim projection for classification
+                        self.current_articles.append(
+                            {k: article.get(k) for k in _ARTICLE_KEEP_FIELDS})
+                        if len(self.current_articles) > self._max_articles:
+                            del self.current_articles[:-self._max_articles]
+        else:
+            # Handle unexpected response format
+            self.append_text(f"[{i}] Query: {result.get('query', 'Unknown')}\n", 'query')
+            self.append_text(f"    Status: Unexpected response format\n", 'error')
+            self.append_text(f"    Response: {result}\n\n")
+
     def _on_classify(self) -> None:
         """Handle classify button click."""
         if self.on_classify and self.current_articles:
@@ -473,29 +628,29 @@ class ResultsComponent:
         Args:
             classification: The classification result text
         """
-        print(f"DEBUG: display_classification called with: {classification[:200] if classification else 'None'}")
+        _dbg(f"DEBUG: display_classification called with: {classification[:200] if classification else 'None'}")
         self.current_classification = classification
-        self.append_text("\n" + "=" * 80 + "\n", 'header')
-        self.append_text("CLASSIFICAÇÃO GLM\n", 'header')
-        self.append_text("=" * 80 + "\n\n", 'header')
-        self.append_text(classification + "\n", 'classification')
-        self.append_text("=" * 80 + "\n", 'header')
-        # Scroll to the end to show the classification
-        self.results_text.see(tk.END)
+        with self._frozen_text():
+            self.append_text("\n" + _SEP80, 'header')
+            self.append_text("CLASSIFICAÇÃO GLM\n", 'header')
+            self.append_text(_SEP80 + "\n", 'header')
+            self.append_text(classification + "\n", 'classification')
+            self.append_text(_SEP80, 'header')
+            self.flush()
         
         # Hide classify button, show abort and generate buttons
         self.classify_button.pack_forget()
-        self.abort_button.config(state='normal')
-        self.generate_post_button.config(state='normal')
+        self._show(self.abort_button)
+        self._show(self.generate_post_button)
     
     
     def reset_to_search_state(self) -> None:
         """Reset UI to initial search state."""
         # Hide all action buttons
-        self.abort_button.config(state='hidden')
-        self.generate_post_button.config(state='hidden')
-        self.generate_image_button.config(state='hidden')
-        self.show_modal_button.config(state='hidden')
+        self._hide(self.abort_button)
+        self._hide(self.generate_post_button)
+        self._hide(self.generate_image_button)
+        self._hide(self.show_modal_button)
         
         # Show classify button (disabled)
         self.classify_button.pack(side='right')
@@ -516,6 +671,7 @@ class ResultsComponent:
             error_msg: The error message to display
         """
         self.append_text(f"Error: {error_msg}\n", 'error')
+        self.flush()
     
     def display_generated_post(self, post: str) -> None:
         """
@@ -525,16 +681,16 @@ class ResultsComponent:
             post: The generated post text
         """
         self.current_post = post
-        self.append_text("\n" + "=" * 80 + "\n", 'header')
-        self.append_text("LINKEDIN POST GERADO\n", 'header')
-        self.append_text("=" * 80 + "\n\n", 'header')
-        self.append_text(post + "\n", 'success')
-        self.append_text("=" * 80 + "\n", 'header')
-        # Scroll to the end to show the post
-        self.results_text.see(tk.END)
+        with self._frozen_text():
+            self.append_text("\n" + _SEP80, 'header')
+            self.append_text("LINKEDIN POST GERADO\n", 'header')
+            self.append_text(_SEP80 + "\n", 'header')
+            self.append_text(post + "\n", 'success')
+            self.append_text(_SEP80, 'header')
+            self.flush()
         
         # Show generate image button
-        self.generate_image_button.config(state='normal')
+        self._show(self.generate_image_button)
     
     def display_generated_image(self, image_url: str, local_image_path: str = "") -> None:
         """
@@ -546,19 +702,19 @@ class ResultsComponent:
         """
         self.current_image_url = image_url
         self.current_local_image_path = local_image_path
-        self.append_text("\n" + "=" * 80 + "\n", 'header')
-        self.append_text("IMAGEM GERADA\n", 'header')
-        self.append_text("=" * 80 + "\n\n", 'header')
-        if local_image_path:
-            self.append_text(f"Local: {local_image_path}\n", 'success')
-        else:
-            self.append_text(f"Image URL: {image_url}\n", 'success')
-        self.append_text("=" * 80 + "\n", 'header')
-        # Scroll to the end to show the image URL
-        self.results_text.see(tk.END)
+        with self._frozen_text():
+            self.append_text("\n" + _SEP80, 'header')
+            self.append_text("IMAGEM GERADA\n", 'header')
+            self.append_text(_SEP80 + "\n", 'header')
+            if local_image_path:
+                self.append_text(f"Local: {local_image_path}\n", 'success')
+            else:
+                self.append_text(f"Image URL: {image_url}\n", 'success')
+            self.append_text(_SEP80, 'header')
+            self.flush()
         
         # Show modal button
-        self.show_modal_button.config(state='normal')
+        self._show(self.show_modal_button)
     
     def _get_mode_description(self, mode: str) -> str:
         """
@@ -570,17 +726,28 @@ class ResultsComponent:
         Returns:
             Description of the mode
         """
-        descriptions = {
-            "everything": "Search all news",
-            "top-headlines": "Top headlines",
-            "sources": "News sources"
-        }
-        return descriptions.get(mode, "Unknown mode")
+        return _MODE_DESCRIPTIONS.get(mode, "Unknown mode")
 
 
 class LinkedInModal:
     """Modal window for LinkedIn post preview."""
-    
+
+    # Shared label options and lazily created Tcl font resources, so each
+    # modal open reuses the same font objects instead of re-parsing tuples
+    _LABEL_WHITE = {'bg': 'white'}
+    _FONT_BOLD_14 = None
+    _FONT_14 = None
+    _FONT_12 = None
+    _FONT_11 = None
+
+    # The action row never changes; build the spec once per process
+    _ACTION_BUTTONS = (
+        ("👍 Like", "#666666"),
+        ("💬 Comment", "#666666"),
+        ("🔄 Repost", "#666666"),
+        ("📤 Send", "#666666"),
+    )
+
     def __init__(self, parent: tk.Widget, styles: GUIStyles, post: str, image_url: str, local_image_path: str = None):
         """
         Initialize the LinkedIn modal.
@@ -598,7 +765,15 @@ class LinkedInModal:
         self.image_url = image_url
         self.local_image_path = local_image_path
         self.photo = None  # Keep reference to photo
-        
+
+        # Fonts need a running Tk interpreter, so create them on first use
+        if LinkedInModal._FONT_BOLD_14 is None:
+            from tkinter import font as tkfont
+            LinkedInModal._FONT_BOLD_14 = tkfont.Font(family='Arial', size=14, weight='bold')
+            LinkedInModal._FONT_14 = tkfont.Font(family='Arial', size=14)
+            LinkedInModal._FONT_12 = tkfont.Font(family='Arial', size=12)
+            LinkedInModal._FONT_11 = tkfont.Font(family='Arial', size=11)
+
         # Create modal window
         self.window = tk.Toplevel(parent)
         self.window.title("LinkedIn Post Preview")
@@ -609,10 +784,13 @@ class LinkedInModal:
         # Handle window close
         self.window.protocol("WM_DELETE_WINDOW", self.on_close)
         
-        self._build()
+        self._build_chrome()
     
-    def _build(self) -> None:
-        """Build the modal UI with LinkedIn-like styling."""
+    def _build_chrome(self) -> None:
+        """Build the modal chrome (header, canvas, scrollbar) eagerly.
+
+        The post card itself is deferred to an after_idle callback so the
+        window maps and paints before the text layout work happens."""
         # Main container with LinkedIn-style background
         main_frame = tk.Frame(self.window, bg='#f3f2ef')
         main_frame.pack(fill='both', expand=True)
@@ -645,21 +823,43 @@ class LinkedInModal:
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
-        # Mouse wheel scrolling (bind to canvas instead of bind_all)
+        # Mouse wheel scrolling, bound locally (bind_all would fire for
+        # every widget in the interpreter, including the main window).
+        # Deltas are coalesced so a fast wheel burst scrolls once per frame.
+        def _do_scroll():
+            delta, self._wheel_delta = self._wheel_delta, 0
+            self._scroll_job = None
+            if delta:
+                try:
+                    canvas.yview_scroll(delta, "units")
+                except tk.TclError:
+                    # Canvas has been destroyed, ignore the error
+                    pass
+
         def _on_mousewheel(event):
-            try:
-                canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-            except tk.TclError:
-                # Canvas has been destroyed, ignore the error
-                pass
-        
+            self._wheel_delta += int(-1 * (event.delta / 120))
+            if self._scroll_job is None:
+                self._scroll_job = canvas.after(16, _do_scroll)
+
+        self._wheel_delta = 0
+        self._scroll_job = None
+        self._canvas = canvas
         canvas.bind("<MouseWheel>", _on_mousewheel)
+        scrollable_frame.bind("<MouseWheel>", _on_mousewheel)
         
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
-        
+
+        self._scrollable_frame = scrollable_frame
+        self.window.after_idle(self._build_content)
+
+    def _build_content(self) -> None:
+        """Build the post card inside the scrollable area (deferred)."""
+        if not self.window.winfo_exists():
+            # Modal was closed before the idle callback ran
+            return
         # Container for scrollable content with padding
-        content_container = tk.Frame(scrollable_frame, bg='#f3f2ef')
+        content_container = tk.Frame(self._scrollable_frame, bg='#f3f2ef')
         content_container.pack(fill='both', expand=True, padx=20, pady=20)
         
         # Post card (LinkedIn style)
@@ -679,9 +879,9 @@ class LinkedInModal:
         # Author info
         author_frame = tk.Frame(post_header, bg='white')
         author_frame.pack(side='left', padx=10)
-        tk.Label(author_frame, text="Your Name", bg='white', font=('Arial', 14, 'bold')).pack(anchor='w')
-        tk.Label(author_frame, text="Professional Network", bg='white', fg='#666666', font=('Arial', 12)).pack(anchor='w')
-        tk.Label(author_frame, text="1h • 🌐", bg='white', fg='#666666', font=('Arial', 11)).pack(anchor='w')
+        tk.Label(author_frame, text="Your Name", font=self._FONT_BOLD_14, **self._LABEL_WHITE).pack(anchor='w')
+        tk.Label(author_frame, text="Professional Network", fg='#666666', font=self._FONT_12, **self._LABEL_WHITE).pack(anchor='w')
+        tk.Label(author_frame, text="1h • 🌐", fg='#666666', font=self._FONT_11, **self._LABEL_WHITE).pack(anchor='w')
         
         # Image display (BEFORE text)
         if self.local_image_path:
@@ -695,33 +895,20 @@ class LinkedInModal:
                                        bg='#0a66c2', fg='white', font=('Arial', 10),
                                        padx=10, pady=5, borderwidth=0, relief='flat')
             
-            # Try to load and display the actual image
-            try:
-                pil_image = Image.open(self.local_image_path)
-                
-                # Resize image if too large (max 500px width)
-                max_width = 500
-                if pil_image.width > max_width:
-                    ratio = max_width / pil_image.width
-                    new_height = int(pil_image.height * ratio)
-                    pil_image = pil_image.resize((max_width, new_height), Image.Resampling.LANCZOS)
-                
-                self.photo = ImageTk.PhotoImage(pil_image)
-                image_label = tk.Label(image_frame, image=self.photo, bg='white')
-                image_label.pack(pady=10)
-                
-                # Show/hide copy button on hover
-                image_label.bind('<Enter>', lambda e: copy_image_btn.pack(pady=5))
-                image_label.bind('<Leave>', lambda e: copy_image_btn.pack_forget())
-                image_frame.bind('<Enter>', lambda e: copy_image_btn.pack(pady=5))
-                image_frame.bind('<Leave>', lambda e: copy_image_btn.pack_forget())
-            except Exception as e:
-                # Fallback to placeholder if image loading fails
-                print(f"DEBUG: Failed to load image: {e}")
-                image_label = tk.Label(image_frame, text="🖼️ Image Generated",
-                                     bg='white', fg='#666666', font=('Arial', 12))
-                image_label.pack(pady=10)
-            
+            # Placeholder shown while the image decodes on a worker thread;
+            # keeps the modal responsive for large files
+            image_label = tk.Label(image_frame, text="🖼️ Loading image...",
+                                 fg='#666666', font=self._FONT_12, **self._LABEL_WHITE)
+            image_label.pack(pady=10)
+            self._image_label = image_label
+            self._image_frame = image_frame
+            self._copy_image_btn = copy_image_btn
+            self._copy_image_place = {'relx': 1.0, 'rely': 0.0, 'anchor': 'ne'}
+
+            future = _IMAGE_POOL.submit(self._decode_image, self.local_image_path, 500)
+            future.add_done_callback(
+                lambda f: self.window.after(0, self._install_photo, f))
+
             # URL label
             url_label = tk.Label(image_frame, text=self.image_url[:80] + "..." if len(self.image_url) > 80 else self.image_url,
                                bg='white', fg='#0a66c2', font=('Arial', 9), cursor='hand2')
@@ -732,38 +919,39 @@ class LinkedInModal:
         post_content.pack(fill='both', expand=True, padx=15, pady=(5, 10))
         
         # Copy text button (hidden by default, shown on hover)
-        copy_text_btn = tk.Button(post_content, text="📋 Copiar Texto",
+        self._copy_text_btn = tk.Button(post_content, text="📋 Copiar Texto",
                                   command=self._copy_text,
                                   bg='#0a66c2', fg='white', font=('Arial', 10),
                                   padx=10, pady=5, borderwidth=0, relief='flat')
         
-        # Post text
+        # Post text: undo and separator bookkeeping are pointless for a
+        # read-only view and slow down the bulk insert of a long post.
+        # Tk's own word wrap stays on so lines always fit the widget's
+        # actual width; a fixed-column Python pre-wrap clipped the right
+        # edge at this font size.
         post_text = tk.Text(post_content, wrap='word', bg='white', borderwidth=0,
-                           font=('Arial', 14), height=10)
+                           font=('Arial', 14), height=10,
+                           undo=False, autoseparators=False, maxundo=0)
         post_text.pack(fill='both', expand=True)
-        post_text.insert(1.0, self.post)
+        post_text.insert('end', self.post)
+        post_text.mark_set('insert', '1.0')
         post_text.config(state='disabled')
         
-        # Show/hide copy button on hover
-        post_text.bind('<Enter>', lambda e: copy_text_btn.pack(pady=5))
-        post_text.bind('<Leave>', lambda e: copy_text_btn.pack_forget())
-        post_content.bind('<Enter>', lambda e: copy_text_btn.pack(pady=5))
-        post_content.bind('<Leave>', lambda e: copy_text_btn.pack_forget())
+        # Show/hide copy button on hover: one delegated binding on the card
+        # instead of per-child bindings, so crossing child boundaries does
+        # not fire redundant pack/pack_forget calls
+        self._post_card = post_card
+        self._copy_btn_visible = False
+        post_card.bind('<Enter>', self._on_card_enter)
+        post_card.bind('<Leave>', self._on_card_leave)
         
         # Post actions (like, comment, share)
         actions_frame = tk.Frame(post_card, bg='white')
         actions_frame.pack(fill='x', padx=15, pady=(5, 10))
         
-        action_buttons = [
-            ("👍 Like", "#666666"),
-            ("💬 Comment", "#666666"),
-            ("🔄 Repost", "#666666"),
-            ("📤 Send", "#666666")
-        ]
-        
-        for text, color in action_buttons:
+        for text, color in self._ACTION_BUTTONS:
             btn = tk.Button(actions_frame, text=text, bg='white', fg=color,
-                           borderwidth=0, font=('Arial', 14), padx=10)
+                           borderwidth=0, font=self._FONT_14, padx=10)
             btn.pack(side='left', padx=5)
         
         # Close button at bottom (inside scrollable area)
@@ -774,6 +962,104 @@ class LinkedInModal:
                              padx=20, pady=8, borderwidth=0)
         close_btn.pack()
     
+    @staticmethod
+    def _thumb_path(path: str, max_width: int) -> str:
+        """Return the cache path for a downscaled preview of the given file."""
+        stat = os.stat(path)
+        key = hashlib.blake2b(
+            f"{path}|{stat.st_mtime_ns}|{stat.st_size}|{max_width}".encode(),
+            digest_size=8).hexdigest()
+        return os.path.join(_THUMB_DIR, f"{key}.png")
+
+    @staticmethod
+    def _decode_image(path: str, max_width: int):
+        """
+        Open and downscale the preview image (runs on a worker thread).
+
+        The downscaled result is cached on disk keyed by source path, mtime
+        and size, so reopening the modal for the same image skips the
+        decode and resize entirely.
+        """
+        try:
+            thumb = LinkedInModal._thumb_path(path, max_width)
+        except OSError:
+            thumb = None
+        if thumb and os.path.exists(thumb):
+            pil_image = Image.open(thumb)
+            pil_image.load()
+            return pil_image
+
+        pil_image = Image.open(path)
+        if pil_image.width > max_width:
+            # For JPEG sources draft() lets libjpeg decode at a reduced
+            # scale almost for free; it's a no-op for other formats
+            pil_image.draft('RGB', (max_width * 2, max_width * 2))
+            # BILINEAR is plenty for a screen preview and much cheaper than
+            # LANCZOS; thumbnail() keeps the aspect ratio without manual math
+            pil_image.thumbnail((max_width, max_width * 10), Image.Resampling.BILINEAR)
+
+        if thumb:
+            try:
+                os.makedirs(_THUMB_DIR, exist_ok=True)
+                pil_image.save(thumb, optimize=True)
+            except OSError:
+                pass
+        return pil_image
+
+    def _install_photo(self, future) -> None:
+        """Build the PhotoImage on the Tk thread and swap out the placeholder."""
+        try:
+            pil_image = future.result()
+        except Exception as e:
+            # Fallback to placeholder if image loading fails
+            _dbg(f"DEBUG: Failed to load image: {e}")
+            try:
+                self._image_label.config(text="🖼️ Image Generated")
+            except tk.TclError:
+                pass
+            return
+
+        try:
+            self.photo = ImageTk.PhotoImage(pil_image)
+            self._image_label.config(image=self.photo, text='')
+        except tk.TclError:
+            # Modal was closed before the image finished decoding
+            return
+
+        # Show/hide copy button on hover
+        self._image_label.bind('<Enter>', self._show_copy_btn)
+        self._image_label.bind('<Leave>', self._hide_copy_btn)
+        self._image_frame.bind('<Enter>', self._show_copy_btn)
+        self._image_frame.bind('<Leave>', self._hide_copy_btn)
+
+    def _on_card_enter(self, event=None) -> None:
+        """Show the copy-text button when the pointer enters the post card."""
+        if not self._copy_btn_visible:
+            self._copy_btn_visible = True
+            # place() only positions this one widget; pack() would reflow
+            # the whole card on every hover
+            self._copy_text_btn.place(relx=1.0, rely=0.0, anchor='ne')
+
+    def _on_card_leave(self, event) -> None:
+        """Hide the copy-text button, but only on a real exit — Leave also
+        fires when the pointer moves onto a child of the card."""
+        widget = self.window.winfo_containing(event.x_root, event.y_root)
+        while widget is not None:
+            if widget is self._post_card:
+                return
+            widget = widget.master
+        if self._copy_btn_visible:
+            self._copy_btn_visible = False
+            self._copy_text_btn.place_forget()
+
+    def _show_copy_btn(self, event=None) -> None:
+        """Show the copy-image button while hovering the preview."""
+        self._copy_image_btn.place(**self._copy_image_place)
+
+    def _hide_copy_btn(self, event=None) -> None:
+        """Hide the copy-image button when the pointer leaves the preview."""
+        self._copy_image_btn.place_forget()
+
     def _copy_text(self) -> None:
         """Copy the post text to clipboard."""
         self.window.clipboard_clear()
@@ -781,20 +1067,71 @@ class LinkedInModal:
         self.window.update()
     
     def _copy_image(self) -> None:
-        """Copy the image to clipboard."""
-        if self.local_image_path:
-            try:
-                # Read the image file
-                with open(self.local_image_path, 'rb') as f:
-                    image_data = f.read()
-                
-                # Put image data on clipboard
-                self.window.clipboard_clear()
-                self.window.clipboard_append(image_data)
-                self.window.update()
-            except Exception as e:
-                print(f"DEBUG: Failed to copy image: {e}")
+        """Copy the image to the clipboard via the platform's native API.
+
+        Tk's clipboard only carries text, so appending raw image bytes
+        produced garbled text after a full UTF-8 scan of the file; the
+        native paths below put an actual pasteable image on the clipboard.
+        """
+        if not self.local_image_path:
+            return
+        try:
+            if sys.platform == 'win32':
+                self._copy_image_windows(self.local_image_path)
+            elif sys.platform == 'darwin':
+                script = ('set the clipboard to (read (POSIX file '
+                          f'"{self._as_png(self.local_image_path)}") as «class PNGf»)')
+                subprocess.run(['osascript', '-e', script], check=True)
+            else:
+                subprocess.run(['xclip', '-selection', 'clipboard',
+                                '-t', 'image/png',
+                                '-i', self._as_png(self.local_image_path)],
+                               check=True)
+        except Exception as e:
+            _dbg(f"DEBUG: Failed to copy image: {e}")
+
+    @staticmethod
+    def _as_png(path: str) -> str:
+        """Return an absolute path to a PNG copy of the image.
+
+        Generated images are saved as .webp, but the macOS and Linux
+        clipboard commands above declare PNG data; handing them webp
+        bytes produces broken pastes, so convert once next to the
+        original and reuse the copy afterwards."""
+        path = os.path.abspath(path)
+        if path.lower().endswith('.png'):
+            return path
+        png_path = os.path.splitext(path)[0] + '.png'
+        if not os.path.exists(png_path):
+            Image.open(path).save(png_path, 'PNG')
+        return png_path
+
+    @staticmethod
+    def _copy_image_windows(path: str) -> None:
+        """Place the image on the Windows clipboard as a DIB."""
+        import win32clipboard
+        from io import BytesIO
+
+        output = BytesIO()
+        Image.open(path).convert('RGB').save(output, 'BMP')
+        data = output.getvalue()[14:]  # drop BITMAPFILEHEADER, keep the DIB
+        win32clipboard.OpenClipboard()
+        try:
+            win32clipboard.EmptyClipboard()
+            win32clipboard.SetClipboardData(win32clipboard.CF_DIB, data)
+        finally:
+            win32clipboard.CloseClipboard()
     
     def on_close(self) -> None:
         """Handle window close."""
+        if self._scroll_job is not None:
+            try:
+                self._canvas.after_cancel(self._scroll_job)
+            except tk.TclError:
+                pass
+            self._scroll_job = None
+        try:
+            self._canvas.unbind("<MouseWheel>")
+        except tk.TclError:
+            pass
         self.window.destroy()
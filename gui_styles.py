@@ -4,23 +4,39 @@ Contains style configurations for the TuningSearch GUI application.
 """
 
 import tkinter as tk
+import weakref
 from tkinter import ttk
 
 
 class GUIStyles:
     """Class to manage GUI styles and colors."""
-    
+
+    # Named ttk styles are process-global, so each Style object only
+    # needs configuring once no matter how many windows are opened
+    _configured = weakref.WeakSet()
+
     def __init__(self):
         """Initialize the GUI styles."""
+        # Fixed palette as plain attributes: hot paths read these directly
+        # without a dict hash per lookup
+        self.primary = '#2c3e50'
+        self.secondary = '#34495e'
+        self.accent = '#3498db'
+        self.success = '#27ae60'
+        self.warning = '#f39c12'
+        self.danger = '#e74c3c'
+        self.light = '#ecf0f1'
+        self.white = '#ffffff'
+        # Kept for callers that still look colors up by name
         self.colors = {
-            'primary': '#2c3e50',
-            'secondary': '#34495e',
-            'accent': '#3498db',
-            'success': '#27ae60',
-            'warning': '#f39c12',
-            'danger': '#e74c3c',
-            'light': '#ecf0f1',
-            'white': '#ffffff'
+            'primary': self.primary,
+            'secondary': self.secondary,
+            'accent': self.accent,
+            'success': self.success,
+            'warning': self.warning,
+            'danger': self.danger,
+            'light': self.light,
+            'white': self.white
         }
     
     def configure_styles(self, style: ttk.Style) -> None:
@@ -30,53 +46,57 @@ class GUIStyles:
         Args:
             style: The ttk.Style object to configure
         """
+        if style in self._configured:
+            return
+        self._configured.add(style)
+
         # Use modern theme
         style.theme_use('clam')
         
         # Header frame style
-        style.configure('Header.TFrame', background=self.colors['primary'])
+        style.configure('Header.TFrame', background=self.primary)
         
         # Title label style
         style.configure('Title.TLabel', 
-                       background=self.colors['primary'],
-                       foreground=self.colors['white'],
+                       background=self.primary,
+                       foreground=self.white,
                        font=('Segoe UI', 16, 'bold'))
         
         # Subtitle label style
         style.configure('Subtitle.TLabel',
-                       background=self.colors['primary'],
-                       foreground=self.colors['light'],
+                       background=self.primary,
+                       foreground=self.light,
                        font=('Segoe UI', 9))
         
         # Input frame style
-        style.configure('Input.TFrame', background=self.colors['light'])
+        style.configure('Input.TFrame', background=self.light)
         
         # Label style
         style.configure('TLabel',
-                       background=self.colors['white'],
-                       foreground=self.colors['primary'],
+                       background=self.white,
+                       foreground=self.primary,
                        font=('Segoe UI', 10))
         
         # Button styles
         style.configure('Primary.TButton',
-                       background=self.colors['accent'],
-                       foreground=self.colors['white'],
+                       background=self.accent,
+                       foreground=self.white,
                        font=('Segoe UI', 11, 'bold'),
                        borderwidth=0)
         style.map('Primary.TButton',
                  background=[('active', '#2980b9')])
         
         style.configure('Secondary.TButton',
-                       background=self.colors['secondary'],
-                       foreground=self.colors['white'],
+                       background=self.secondary,
+                       foreground=self.white,
                        font=('Segoe UI', 10),
                        borderwidth=0)
         style.map('Secondary.TButton',
                   background=[('active', '#2c3e50')])
         
         style.configure('Danger.TButton',
-                       background=self.colors['danger'],
-                       foreground=self.colors['white'],
+                       background=self.danger,
+                       foreground=self.white,
                        font=('Segoe UI', 10),
                        borderwidth=0)
         style.map('Danger.TButton',
@@ -84,11 +104,11 @@ class GUIStyles:
         
         # Status label style
         style.configure('Status.TLabel',
-                       background=self.colors['light'],
+                       background=self.light,
                        font=('Segoe UI', 9))
         
         # Result frame style
-        style.configure('Result.TFrame', background=self.colors['white'])
+        style.configure('Result.TFrame', background=self.white)
     
     def get_color(self, name: str) -> str:
         """
@@ -3,50 +3,94 @@ Image Generator Module
 Handles image generation using Replicate API.
 """
 
+import atexit
+import functools
+import re
 import requests
 import time
+from requests.adapters import HTTPAdapter
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional
 from config import Config
-from datetime import datetime
+from pathlib import Path
 import os
 
+# Debug output is opt-in; when disabled the shim discards its arguments
+# without ever stringifying them (the response dicts can be several KB)
+_dbg = print if os.getenv("NEWSAPI_DEBUG") else (lambda *args, **kwargs: None)
+
+# Single writer thread so history appends never delay a generation result
+_io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='imagegen-io')
+
+# Workers for the async generation API; generation is network-bound, so a
+# small pool is plenty
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='imagegen')
+
+# Shared session so retries and the follow-up download reuse pooled TLS
+# connections instead of re-handshaking per request
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Title markers stripped from the first line of a post, including
+# repeated/stacked ones like "## **Foo**"
+_TITLE_RE = re.compile(r'^(?:#+\s*|\*\*\s*|Título:\s*|Title:\s*)+')
+
+
+@functools.lru_cache(maxsize=64)
+def _extract_theme(post: str) -> str:
+    """
+    Extract the main theme from a LinkedIn post.
+
+    The same post usually flows through both generators, so the result is
+    memoized; only the first line is sliced out rather than splitting the
+    whole post into a line list.
+
+    Args:
+        post: The LinkedIn post text
+
+    Returns:
+        A brief theme description
+    """
+    post = post.strip()
+    nl = post.find('\n')
+    first_line = post if nl == -1 else post[:nl]
+    # Remove common title markers in one compiled pass
+    first_line = _TITLE_RE.sub('', first_line, count=1).strip()
+    return first_line[:100]  # Limit to 100 characters
+
 
 class ImageGenerator:
     """Generator for images using Replicate API."""
-    
+
+    # Minimum spacing between consecutive API calls (seconds)
+    _MIN_INTERVAL = 0.5
+    _last_request_time = 0.0
+
     def __init__(self):
         """Initialize Image generator."""
         self.api_token = Config.REPLICATE_API_TOKEN
         self.api_base = "https://api.replicate.com/v1"
+        self._session = _SESSION
         self.timeout = 120  # seconds - image generation can take longer
         self.history_file = "image_generation_history.txt"
+        self._history_fh = None  # opened lazily on first history write
         self.images_dir = "images"
         
-        # Create images directory if it doesn't exist
-        if not os.path.exists(self.images_dir):
-            os.makedirs(self.images_dir)
-    
-    def _extract_theme_from_post(self, post: str) -> str:
-        """
-        Extract the main theme from the LinkedIn post.
-        
-        Args:
-            post: The LinkedIn post text
-            
-        Returns:
-            A brief theme description
-        """
-        # Try to extract the first line or title
-        lines = post.strip().split('\n')
-        if lines:
-            first_line = lines[0].strip()
-            # Remove common title markers
-            for marker in ['#', '**', 'Título:', 'Title:']:
-                if first_line.startswith(marker):
-                    first_line = first_line[len(marker):].strip()
-            return first_line[:100]  # Limit to 100 characters
-        return "business and technology"
+        # Create images directory if it doesn't exist (atomic, race-free)
+        self._images_root = Path(self.images_dir)
+        self._images_root.mkdir(parents=True, exist_ok=True)
     
+    @classmethod
+    def _respect_min_interval(cls) -> None:
+        """Sleep just long enough to keep requests _MIN_INTERVAL apart.
+
+        Replaces the old unconditional 0.5 s pre-delay: when the API has
+        been idle there is no wait at all."""
+        wait = cls._MIN_INTERVAL - (time.monotonic() - cls._last_request_time)
+        if wait > 0:
+            time.sleep(wait)
+        cls._last_request_time = time.monotonic()
+
     def generate_image(self, post: str) -> str:
         """
         Generate an image based on the LinkedIn post using Replicate API.
@@ -64,7 +108,7 @@ class ImageGenerator:
             return "Erro: REPLICATE_API_TOKEN não configurado. Adicione ao arquivo .env"
         
         # Extract theme from post
-        theme = self._extract_theme_from_post(post)
+        theme = _extract_theme(post)
         
         # Build the prompt for image generation
         prompt = f"""Editorial-style conceptual image representing: {theme}.
@@ -83,21 +127,20 @@ class ImageGenerator:
         
         for attempt in range(max_retries):
             try:
-                # Add small delay before request to avoid rate limit
+                # Back off only after an actual 429; the first attempt is
+                # gated by the spacing check instead of a blind pre-delay
                 if attempt > 0:
                     delay = base_delay * (2 ** attempt)
                     print(f"Rate limit detected. Waiting {delay} seconds before retry {attempt + 1}/{max_retries}...")
                     time.sleep(delay)
                 else:
-                    # Initial small delay for first request
-                    time.sleep(0.5)
+                    self._respect_min_interval()
                 
                 # Build the request
                 url = f"{self.api_base}/predictions"
                 headers = {
                     "Authorization": f"Bearer {self.api_token}",
-                    "Content-Type": "application/json",
-                    "Prefer": "wait"
+                    "Content-Type": "application/json"
                 }
                 
                 payload = {
@@ -115,17 +158,17 @@ class ImageGenerator:
                     }
                 }
                 
-                print(f"DEBUG: Sending image generation request to {url}")
-                print(f"DEBUG: Prompt: {prompt[:100]}...")
+                _dbg(f"DEBUG: Sending image generation request to {url}")
+                _dbg(f"DEBUG: Prompt: {prompt[:100]}...")
                 
-                response = requests.post(
+                response = self._session.post(
                     url,
                     headers=headers,
                     json=payload,
-                    timeout=self.timeout
+                    timeout=(Config.CONNECT_TIMEOUT, 30)
                 )
                 
-                print(f"DEBUG: Response status code: {response.status_code}")
+                _dbg(f"DEBUG: Response status code: {response.status_code}")
                 
                 # Check for rate limit error
                 if response.status_code == 429:
@@ -136,9 +179,9 @@ class ImageGenerator:
                         return "Erro: Limite de taxa da API excedido. Tente novamente em alguns minutos."
                 
                 response.raise_for_status()
-                result = response.json()
+                result = self._wait_for_prediction(response.json(), headers)
                 
-                print(f"DEBUG: Response: {result}")
+                _dbg("DEBUG: Response:", result)
                 
                 # Extract image URL from response
                 image_url = ""
@@ -154,9 +197,9 @@ class ImageGenerator:
                 if image_url:
                     local_path = self._download_image(image_url)
                 
-                # Save to history file
+                # Save to history file off the result path
                 if image_url:
-                    self._save_to_history(image_url, prompt, local_path)
+                    _io_pool.submit(self._save_to_history, image_url, prompt, local_path)
                 
                 if local_path:
                     return local_path
@@ -178,6 +221,54 @@ class ImageGenerator:
         # If we get here, all retries failed
         return "Erro: Não foi possível gerar a imagem após múltiplas tentativas. Tente novamente mais tarde."
     
+    def generate_image_async(self, post: str) -> Future:
+        """
+        Generate an image on a worker thread without blocking the caller.
+
+        Returns a Future; GUI callers should chain a completion callback
+        that marshals back to Tk, e.g.
+        ``fut.add_done_callback(lambda f: root.after(0, on_done, f))``.
+
+        Args:
+            post: The LinkedIn post text
+
+        Returns:
+            A Future resolving to the same value generate_image returns
+        """
+        return _executor.submit(self.generate_image, post)
+
+    def _wait_for_prediction(self, prediction: dict, headers: dict) -> dict:
+        """
+        Poll a prediction until it reaches a terminal state.
+
+        The create call returns immediately; instead of holding the request
+        open for the whole generation with "Prefer: wait", poll the
+        prediction URL with increasing delays so no connection is pinned
+        for up to two minutes.
+
+        Args:
+            prediction: The prediction dict returned by the create call
+            headers: Request headers including authorization
+
+        Returns:
+            The final prediction dict
+        """
+        poll_url = (prediction.get("urls") or {}).get("get")
+        if not poll_url:
+            return prediction
+
+        deadline = time.monotonic() + self.timeout
+        delay = 0.5
+        while (prediction.get("status") not in ("succeeded", "failed", "canceled")
+               and time.monotonic() < deadline):
+            time.sleep(delay)
+            delay = min(delay * 2, 5)
+            response = self._session.get(poll_url, headers=headers,
+                                         timeout=(Config.CONNECT_TIMEOUT, 30))
+            response.raise_for_status()
+            prediction = response.json()
+        return prediction
+
     def _download_image(self, image_url: str) -> str:
         """
         Download image from URL to local images folder.
@@ -189,23 +280,23 @@ class ImageGenerator:
             Local path to the downloaded image
         """
         try:
-            response = requests.get(image_url, timeout=30)
-            response.raise_for_status()
-            
             # Generate filename from URL
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            ext = ".webp"
-            filename = f"image_{timestamp}{ext}"
-            local_path = os.path.join(self.images_dir, filename)
-            
-            # Save image
-            with open(local_path, 'wb') as f:
-                f.write(response.content)
-            
-            print(f"DEBUG: Image downloaded to: {local_path}")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
+            local_path = os.fspath(self._images_root / f"image_{timestamp}.webp")
+
+            # Stream to disk in chunks instead of buffering the whole
+            # image in memory before the first write
+            with self._session.get(image_url, timeout=(Config.CONNECT_TIMEOUT, 30),
+                                   stream=True) as response:
+                response.raise_for_status()
+                with open(local_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        f.write(chunk)
+
+            _dbg(f"DEBUG: Image downloaded to: {local_path}")
             return local_path
         except Exception as e:
-            print(f"DEBUG: Failed to download image: {e}")
+            _dbg(f"DEBUG: Failed to download image: {e}")
             return ""
     
     def _save_to_history(self, image_url: str, prompt: str, local_path: str = "") -> None:
@@ -218,13 +309,17 @@ class ImageGenerator:
             local_path: Local path to the downloaded image
         """
         try:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
             entry = f"[{timestamp}] URL: {image_url}\nLocal: {local_path}\nPrompt: {prompt[:100]}...\n{'-' * 80}\n\n"
             
-            # Append to history file
-            with open(self.history_file, 'a', encoding='utf-8') as f:
-                f.write(entry)
+            # Keep one line-buffered append handle instead of paying an
+            # open/close per entry; writes run on the single IO thread
+            if self._history_fh is None:
+                self._history_fh = open(self.history_file, 'a',
+                                        encoding='utf-8', buffering=1)
+                atexit.register(self._history_fh.close)
+            self._history_fh.write(entry)
             
-            print(f"DEBUG: Saved to history file: {self.history_file}")
+            _dbg(f"DEBUG: Saved to history file: {self.history_file}")
         except Exception as e:
-            print(f"DEBUG: Failed to save to history: {e}")
+            _dbg(f"DEBUG: Failed to save to history: {e}")
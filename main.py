@@ -8,10 +8,15 @@ import io
 from typing import List
 from tuning_search import TuningSearchClient
 
-# Set UTF-8 encoding for Windows console
+# Set UTF-8 encoding for Windows console, unless the streams already use
+# it (e.g. under -X utf8) — rewrapping would add a redundant buffer layer
 if sys.platform == "win32":
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+    if getattr(sys.stdout, 'encoding', '').lower() not in ('utf-8', 'utf8'):
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8',
+                                      line_buffering=True)
+    if getattr(sys.stderr, 'encoding', '').lower() not in ('utf-8', 'utf8'):
+        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8',
+                                      line_buffering=True)
 
 
 def parse_input(input_string: str) -> List[str]:
@@ -24,11 +29,8 @@ def parse_input(input_string: str) -> List[str]:
     Returns:
         List of cleaned search terms
     """
-    # Split by comma and strip whitespace
-    terms = [term.strip() for term in input_string.split(",")]
-    # Filter out empty strings
-    terms = [term for term in terms if term]
-    return terms
+    # Strip whitespace and drop empty entries in a single pass
+    return [s for s in (t.strip() for t in input_string.split(",")) if s]
 
 
 def main():
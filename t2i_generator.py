@@ -3,42 +3,54 @@ T2I Generator Module
 Handles image generation using the Z.AI API.
 """
 
+import os
 import requests
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from typing import Optional
 from config import Config
+from image_generator import _extract_theme
+
+# Debug output is opt-in; when disabled the shim discards its arguments
+# without ever stringifying them (the response dicts can be several KB)
+_dbg = print if os.getenv("NEWSAPI_DEBUG") else (lambda *args, **kwargs: None)
+
+# Workers for the async generation API
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='t2i')
+
+# Shared session so retries reuse pooled TLS connections
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
 
 
 class T2IGenerator:
     """Generator for images using Z.AI API."""
-    
+
+    # Minimum spacing between consecutive API calls (seconds)
+    _MIN_INTERVAL = 0.5
+    _last_request_time = 0.0
+
     def __init__(self):
         """Initialize T2I generator."""
         self.api_key = Config.ZAI_API_KEY
         self.api_base = Config.ZAI_API_BASE
-        self.timeout = 120  # seconds - image generation can take longer
-    
-    def _extract_theme_from_post(self, post: str) -> str:
-        """
-        Extract the main theme from the LinkedIn post.
-        
-        Args:
-            post: The LinkedIn post text
-            
-        Returns:
-            A brief theme description
-        """
-        # Try to extract the first line or title
-        lines = post.strip().split('\n')
-        if lines:
-            first_line = lines[0].strip()
-            # Remove common title markers
-            for marker in ['#', '**', 'Título:', 'Title:']:
-                if first_line.startswith(marker):
-                    first_line = first_line[len(marker):].strip()
-            return first_line[:100]  # Limit to 100 characters
-        return "business and technology"
+        self._session = _SESSION
+        # (connect, read) - image generation reads can take longer, but a
+        # dead host should still fail within the connect budget
+        self.timeout = (Config.CONNECT_TIMEOUT, 120)
     
+    @classmethod
+    def _respect_min_interval(cls) -> None:
+        """Sleep just long enough to keep requests _MIN_INTERVAL apart.
+
+        Replaces the old unconditional 0.5 s pre-delay: when the API has
+        been idle there is no wait at all."""
+        wait = cls._MIN_INTERVAL - (time.monotonic() - cls._last_request_time)
+        if wait > 0:
+            time.sleep(wait)
+        cls._last_request_time = time.monotonic()
+
     def generate_image(self, post: str) -> str:
         """
         Generate an image based on the LinkedIn post using Z.AI API.
@@ -53,7 +65,7 @@ class T2IGenerator:
             return "No post content available for image generation."
         
         # Extract theme from post
-        theme = self._extract_theme_from_post(post)
+        theme = _extract_theme(post)
         
         # Build the prompt for image generation
         prompt = f"""Conceptual professional LinkedIn image about: {theme}.
@@ -68,14 +80,14 @@ No text, no logos, no people smiling."""
         
         for attempt in range(max_retries):
             try:
-                # Add small delay before request to avoid rate limit
+                # Back off only after an actual 429; the first attempt is
+                # gated by the spacing check instead of a blind pre-delay
                 if attempt > 0:
                     delay = base_delay * (2 ** attempt)
                     print(f"Rate limit detected. Waiting {delay} seconds before retry {attempt + 1}/{max_retries}...")
                     time.sleep(delay)
                 else:
-                    # Initial small delay for first request
-                    time.sleep(0.5)
+                    self._respect_min_interval()
                 
                 # Build the request
                 url = f"{self.api_base}/images/generations"
@@ -91,17 +103,17 @@ No text, no logos, no people smiling."""
                     "quality": "standard"
                 }
                 
-                print(f"DEBUG: Sending image generation request to {url}")
-                print(f"DEBUG: Prompt: {prompt[:100]}...")
+                _dbg(f"DEBUG: Sending image generation request to {url}")
+                _dbg(f"DEBUG: Prompt: {prompt[:100]}...")
                 
-                response = requests.post(
+                response = self._session.post(
                     url,
                     headers=headers,
                     json=payload,
                     timeout=self.timeout
                 )
                 
-                print(f"DEBUG: Response status code: {response.status_code}")
+                _dbg(f"DEBUG: Response status code: {response.status_code}")
                 
                 # Check for rate limit error
                 if response.status_code == 429:
@@ -114,7 +126,7 @@ No text, no logos, no people smiling."""
                 response.raise_for_status()
                 result = response.json()
                 
-                print(f"DEBUG: Response: {result}")
+                _dbg("DEBUG: Response:", result)
                 
                 # Extract the image URL from the response
                 if "data" in result and len(result["data"]) > 0:
@@ -134,3 +146,19 @@ No text, no logos, no people smiling."""
         
         # If we get here, all retries failed
         return "Erro: Não foi possível gerar a imagem após múltiplas tentativas. Tente novamente mais tarde."
+
+    def generate_image_async(self, post: str) -> Future:
+        """
+        Generate an image on a worker thread without blocking the caller.
+
+        Returns a Future; GUI callers should chain a completion callback
+        that marshals back to Tk, e.g.
+        ``fut.add_done_callback(lambda f: root.after(0, on_done, f))``.
+
+        Args:
+            post: The LinkedIn post text
+
+        Returns:
+            A Future resolving to the same value generate_image returns
+        """
+        return _executor.submit(self.generate_image, post)
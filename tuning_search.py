@@ -8,10 +8,41 @@ Available modes:
 - sources: Get list of news sources available on the NewsAPI
 """
 
+import json
 import requests
+import time
+from collections import deque
+from requests.adapters import HTTPAdapter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache, partial
+from types import MappingProxyType
 from typing import List, Dict, Optional
 from config import Config
 
+# Pool that carries both the primary requests and their hedged
+# duplicates; sized for the search_multiple fan-out with one spare each
+_hedge_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix='newsapi')
+
+
+class _NA(dict):
+    """Dict that falls back to 'N/A' for missing keys in format_map."""
+
+    def __missing__(self, key):
+        return 'N/A'
+
+
+# Pre-built display template: one format_map per article instead of seven
+# separate f-string appends and dict probes
+_ARTICLE_TMPL = (
+    "    Article {i}:\n"
+    "        Title: {title}\n"
+    "        Source: {source_name}\n"
+    "        Author: {author}\n"
+    "        URL: {url}\n"
+    "        Published: {publishedAt}\n"
+    "        Description: {description}\n"
+)
+
 
 class NewsAPIClient:
     """Client for interacting with NewsAPI.org API."""
@@ -20,13 +51,82 @@ class NewsAPIClient:
     MODE_EVERYTHING = "everything"
     MODE_TOP_HEADLINES = "top-headlines"
     MODE_SOURCES = "sources"
+
+    # Optional query parameters passed straight through to the API
+    _ALLOWED_PARAMS = ("language", "country", "category", "page",
+                       "sources", "domains", "from", "to", "sortBy")
+
+    # Display names per mode, frozen at class scope so lookups don't
+    # rebuild the mapping on every call
+    _MODE_DESCRIPTIONS = MappingProxyType({
+        MODE_EVERYTHING: "Search all news",
+        MODE_TOP_HEADLINES: "Top headlines",
+        MODE_SOURCES: "News sources"
+    })
     
     def __init__(self):
         """Initialize the NewsAPI client."""
         Config.validate()
         self.api_key = Config.NEWS_API_KEY
         self.api_base = Config.NEWS_API_BASE
-        self.timeout = Config.REQUEST_TIMEOUT
+        # (connect, read): connect failures surface fast, reads get the
+        # full budget
+        self.timeout = (Config.CONNECT_TIMEOUT, Config.REQUEST_TIMEOUT)
+        # Keep connections alive across queries; the auth header is set
+        # once on the session instead of rebuilt per call
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=4,
+                                                    pool_maxsize=8))
+        self._session.headers["X-Api-Key"] = self.api_key
+        # Successful responses are cached briefly: repeated queries (page
+        # refreshes, re-classification runs) skip the network entirely
+        self._cache = {}
+        self._cache_ttl = Config.NEWS_CACHE_TTL
+        # Rolling latency samples driving the hedge threshold
+        self._latencies = deque(maxlen=64)
+
+    def clear_cache(self) -> None:
+        """Drop all cached search responses."""
+        self._cache.clear()
+
+    def _timed_get(self, url: str, params: Dict) -> requests.Response:
+        """GET that records the observed latency for hedge adaptation."""
+        start = time.monotonic()
+        response = self._session.get(url, params=params, timeout=self.timeout)
+        self._latencies.append(time.monotonic() - start)
+        return response
+
+    def _hedge_delay(self) -> float:
+        """Delay before duplicating a request (~P95 of recent latency)."""
+        if len(self._latencies) < 10:
+            return Config.NEWS_HEDGE_TIMEOUT
+        ordered = sorted(self._latencies)
+        return max(0.2, ordered[int(len(ordered) * 0.95) - 1])
+
+    def _get_hedged(self, url: str, params: Dict) -> requests.Response:
+        """
+        GET with a hedged duplicate to cut tail latency.
+
+        If the first request hasn't answered within roughly the 95th
+        percentile of recent latencies, an identical second one is fired
+        and whichever returns first wins. A long-tail connection then
+        costs one duplicate call instead of stalling the whole batch;
+        the loser finishes in the background on the shared pool.
+
+        Args:
+            url: The endpoint URL
+            params: Query parameters
+
+        Returns:
+            The winning response
+        """
+        first = _hedge_pool.submit(self._timed_get, url, params)
+        done, _ = wait([first], timeout=self._hedge_delay())
+        if done:
+            return first.result()
+        second = _hedge_pool.submit(self._timed_get, url, params)
+        done, _ = wait([first, second], return_when=FIRST_COMPLETED)
+        return done.pop().result()
     
     def search(self, query: str, mode: str = MODE_EVERYTHING, **kwargs) -> Dict:
         """
@@ -50,10 +150,15 @@ class NewsAPIClient:
         Returns:
             Dictionary containing the search results
         """
+        cache_key = (mode, query, tuple(sorted(kwargs.items())))
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            expires, result = cached
+            if time.monotonic() < expires:
+                return result
+            del self._cache[cache_key]
+
         url = f"{self.api_base}/{mode}"
-        headers = {
-            "X-Api-Key": self.api_key
-        }
         
         # Build query parameters
         params = {}
@@ -62,40 +167,26 @@ class NewsAPIClient:
         else:
             params["q"] = query
         
-        # Add optional parameters
-        if "language" in kwargs:
-            params["language"] = kwargs["language"]
-        if "country" in kwargs:
-            params["country"] = kwargs["country"]
-        if "category" in kwargs:
-            params["category"] = kwargs["category"]
-        if "page" in kwargs:
-            params["page"] = kwargs["page"]
+        # Add optional parameters from the whitelist
+        params.update({k: kwargs[k] for k in self._ALLOWED_PARAMS if k in kwargs})
         # Default pageSize to 10 to limit articles for classification
         params["pageSize"] = kwargs.get("pageSize", 10)
-        if "sources" in kwargs:
-            params["sources"] = kwargs["sources"]
-        if "domains" in kwargs:
-            params["domains"] = kwargs["domains"]
-        if "from" in kwargs:
-            params["from"] = kwargs["from"]
-        if "to" in kwargs:
-            params["to"] = kwargs["to"]
-        if "sortBy" in kwargs:
-            params["sortBy"] = kwargs["sortBy"]
         
         try:
-            response = requests.get(
-                url,
-                headers=headers,
-                params=params,
-                timeout=self.timeout
-            )
+            response = self._get_hedged(url, params)
             response.raise_for_status()
-            result = response.json()
+            # Decode the raw bytes directly; response.json() would first
+            # run charset detection over the (often tens-of-KB) body
+            result = json.loads(response.content)
             # Add query and mode to the response for display purposes
             result["query"] = query
             result["mode"] = mode
+            # Cache successes only; errors should always be retried
+            if result.get("status") == "ok":
+                if len(self._cache) >= 512:
+                    self._cache.clear()
+                self._cache[cache_key] = (time.monotonic() + self._cache_ttl,
+                                          result)
             return result
         except requests.exceptions.RequestException as e:
             return {
@@ -105,25 +196,44 @@ class NewsAPIClient:
                 "status": "failed"
             }
     
+    def iter_search(self, queries: List[str], mode: str = MODE_EVERYTHING, **kwargs):
+        """
+        Search for multiple query terms, yielding each result as it arrives.
+
+        Args:
+            queries: List of search terms
+            mode: The search mode - 'everything', 'top-headlines', or 'sources'
+            **kwargs: Optional parameters passed to search method
+
+        Yields:
+            Dictionary containing the search result for each query
+        """
+        # Prefilter once instead of strip-and-branch inside the loop
+        for query in [s for s in (q.strip() for q in queries if q) if s]:
+            yield self.search(query, mode=mode, **kwargs)
+
     def search_multiple(self, queries: List[str], mode: str = MODE_EVERYTHING, **kwargs) -> List[Dict]:
         """
-        Search for multiple query terms on NewsAPI.
-        
+        Search for multiple query terms on NewsAPI, dispatched concurrently.
+
+        The queries are pure I/O waits, so they run in parallel on a small
+        thread pool: wall time is roughly the slowest query instead of the
+        sum of all of them. Result order matches the input order.
+
         Args:
             queries: List of search terms
             mode: The search mode - 'everything', 'top-headlines', or 'sources'
             **kwargs: Optional parameters passed to search method
-            
+
         Returns:
             List of dictionaries containing search results for each query
         """
-        results = []
-        for query in queries:
-            query = query.strip()
-            if query:
-                result = self.search(query, mode=mode, **kwargs)
-                results.append(result)
-        return results
+        # Single-pass prefilter: each query is stripped exactly once
+        terms = [s for s in (q.strip() for q in queries if q) if s]
+        if len(terms) <= 1:
+            return [self.search(t, mode=mode, **kwargs) for t in terms]
+        with ThreadPoolExecutor(max_workers=min(8, len(terms))) as pool:
+            return list(pool.map(partial(self.search, mode=mode, **kwargs), terms))
     
     @classmethod
     def get_available_modes(cls) -> List[str]:
@@ -146,12 +256,7 @@ class NewsAPIClient:
         Returns:
             Description of the mode
         """
-        descriptions = {
-            cls.MODE_EVERYTHING: "Search all news",
-            cls.MODE_TOP_HEADLINES: "Top headlines",
-            cls.MODE_SOURCES: "News sources"
-        }
-        return descriptions.get(mode, "Unknown mode")
+        return cls._MODE_DESCRIPTIONS.get(mode, "Unknown mode")
     
     def format_results(self, results: List[Dict]) -> str:
         """
@@ -203,17 +308,15 @@ class NewsAPIClient:
                 else:
                     if "articles" in result:
                         for j, article in enumerate(result["articles"], 1):
-                            output.append(f"    Article {j}:")
-                            output.append(f"        Title: {article.get('title', 'N/A')}")
-                            output.append(f"        Source: {article.get('source', {}).get('name', 'N/A')}")
-                            output.append(f"        Author: {article.get('author', 'N/A')}")
-                            output.append(f"        URL: {article.get('url', 'N/A')}")
-                            output.append(f"        Published: {article.get('publishedAt', 'N/A')}")
                             description = article.get('description', 'N/A')
-                            if len(description) > 200:
+                            if description and len(description) > 200:
                                 description = description[:200] + "..."
-                            output.append(f"        Description: {description}")
-                            output.append("")
+                            output.append(_ARTICLE_TMPL.format_map(_NA(
+                                article,
+                                i=j,
+                                source_name=article.get('source', {}).get('name', 'N/A'),
+                                description=description,
+                            )))
             else:
                 # Handle unexpected response format
                 output.append(f"[{i}] Query: {result.get('query', 'Unknown')}")
@@ -223,3 +326,19 @@ class NewsAPIClient:
         
         output.append("=" * 80)
         return "\n".join(output)
+
+
+@lru_cache(maxsize=1)
+def get_newsapi_client() -> NewsAPIClient:
+    """
+    Return the shared NewsAPIClient instance.
+
+    Construction runs Config.validate() and builds the pooled HTTPS
+    session, so callers share one instance instead of paying that setup
+    per use. The underlying requests.Session is safe for concurrent
+    calls, and so is the response cache for this access pattern.
+
+    Returns:
+        The process-wide NewsAPIClient
+    """
+    return NewsAPIClient()
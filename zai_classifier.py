@@ -3,27 +3,245 @@ ZAI Classifier Module
 Handles classification of news articles using ZAI GLM API.
 """
 
+import functools
+import hashlib
+import json
+import os
+import random
 import requests
 import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from requests.adapters import HTTPAdapter
+from types import MappingProxyType
 from typing import List, Dict
 from config import Config
 from zai_prompts import ZAIPrompts
 
+# Debug output is opt-in, matching the rest of the app
+_dbg = print if os.getenv("NEWSAPI_DEBUG") else (lambda *args, **kwargs: None)
+
 
 class ZAIClassifier:
     """Classifier for news articles using ZAI GLM API."""
-    
+
+    # Retry tuning: cap for the jittered backoff between rate-limited calls
+    MAX_RETRIES = 3
+    BASE_DELAY = 2  # seconds
+    MAX_BACKOFF = 30  # seconds
+
     def __init__(self):
         """Initialize<arg_key> ZAI classifier."""
         self.api_key = Config.ZAI_API_KEY
         self.api_base = Config.ZAI_API_BASE
         self.model = Config.ZAI_MODEL
-        self.timeout = Config.REQUEST_TIMEOUT
+        # (connect, read): connect failures surface fast, reads get the
+        # full budget
+        self.timeout = (Config.CONNECT_TIMEOUT, Config.REQUEST_TIMEOUT)
+        # One pooled session: classify and the follow-up post generation
+        # hit the same host back to back, so the TLS connection is reused
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=4,
+                                                    pool_maxsize=8))
+        self._session.headers.update({
+            "Accept-Language": "en-US,en",
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        })
+        # Content-addressed result cache: re-running the same articles or
+        # classification through the model is multi-second work for an
+        # answer we already have
+        self._cache = {}
+        self._cache_ttl = Config.ZAI_CACHE_TTL
     
+    def _cache_get(self, key: str) -> str:
+        """Return a cached, unexpired result for key, or None."""
+        cached = self._cache.get(key)
+        if cached is None:
+            return None
+        expires, result = cached
+        if time.monotonic() >= expires:
+            del self._cache[key]
+            return None
+        return result
+
+    def _cache_put(self, key: str, result: str) -> None:
+        """Store a result unless it is an error message."""
+        if result.startswith("Erro"):
+            return
+        if len(self._cache) >= 256:
+            self._cache.clear()
+        self._cache[key] = (time.monotonic() + self._cache_ttl, result)
+
+    @staticmethod
+    def _articles_key(articles: List[Dict]) -> str:
+        """Content hash for an article set, order-insensitive."""
+        joined = b"|".join(
+            sorted((a.get("url") or a.get("title") or "").encode()
+                   + (a.get("publishedAt") or "").encode()
+                   for a in articles))
+        return "c:" + hashlib.blake2b(joined, digest_size=16).hexdigest()
+
+    @staticmethod
+    def _read_stream(response: requests.Response) -> str:
+        """
+        Collect the assistant text from a streamed (SSE) chat response.
+
+        Tokens are consumed as the server produces them instead of
+        waiting for the full completion to buffer, so the connection is
+        released as soon as generation finishes.
+
+        Args:
+            response: A streaming chat-completions response
+
+        Returns:
+            The concatenated assistant text
+        """
+        parts = []
+        for line in response.iter_lines():
+            if not line.startswith(b"data:"):
+                continue
+            data = line[5:].strip()
+            if data == b"[DONE]":
+                break
+            chunk = json.loads(data)
+            choices = chunk.get("choices")
+            if not choices:
+                continue
+            content = (choices[0].get("delta") or {}).get("content")
+            if content:
+                parts.append(content)
+        return "".join(parts)
+
+    @staticmethod
+    def _parse_retry_after(value: str) -> float:
+        """Parse a Retry-After header (seconds or HTTP-date) into seconds."""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            dt = parsedate_to_datetime(value)
+            return max(0.0, (dt - datetime.now(dt.tzinfo)).total_seconds())
+        except (TypeError, ValueError):
+            return None
+
+    def _request_with_retry(self, payload: Dict) -> requests.Response:
+        """
+        POST a chat payload, retrying rate-limited responses.
+
+        Waits honor the server's Retry-After header when it is present and
+        otherwise use decorrelated jitter, so concurrent batches don't
+        retry in lockstep. There is no blind pre-delay: the first attempt
+        goes out immediately.
+
+        Args:
+            payload: The chat-completions request body
+
+        Returns:
+            The successful response
+
+        Raises:
+            requests.exceptions.HTTPError: on non-retryable status codes,
+                or a 429 once the retries are exhausted
+        """
+        url = f"{self.api_base}/chat/completions"
+        delay = self.BASE_DELAY
+        for attempt in range(self.MAX_RETRIES):
+            response = self._session.post(url, json=payload, stream=True,
+                                          timeout=self.timeout)
+            if response.status_code != 429:
+                try:
+                    response.raise_for_status()
+                except requests.exceptions.HTTPError:
+                    response.close()
+                    raise
+                return response
+            # The body is streamed and never read on this path; close it
+            # so each retry doesn't pin a pooled connection until GC
+            response.close()
+            if attempt == self.MAX_RETRIES - 1:
+                break
+            wait = self._parse_retry_after(response.headers.get("Retry-After"))
+            if wait is None:
+                delay = min(self.MAX_BACKOFF,
+                            random.uniform(self.BASE_DELAY, delay * 3))
+                wait = delay
+            print(f"Rate limit detected. Waiting {wait:.1f} seconds before "
+                  f"retry {attempt + 2}/{self.MAX_RETRIES}...")
+            time.sleep(wait)
+        response.raise_for_status()
+        return response
+
+    # Payload fields shared by every chat call, merged per request;
+    # read-only so no call site can mutate the shared template
+    _DEFAULT_PAYLOAD = MappingProxyType({
+        "temperature": 1,
+        "stream": True,
+        "do_sample": True,
+        "thinking": {
+            "type": "enabled",
+            "clear_thinking": True
+        },
+        "top_p": 0.95,
+        "tool_stream": False,
+        "response_format": {"type": "text"}
+    })
+
+    def _chat(self, system_prompt: str, user_content: str,
+              error_prefix: str) -> str:
+        """
+        Send one chat completion and return the assistant's text.
+
+        Owns the payload construction, retry handling and response
+        parsing that every public method shares.
+
+        Args:
+            system_prompt: The system message content
+            user_content: The user message content
+            error_prefix: Prefix for error strings returned to the caller
+
+        Returns:
+            The model's reply, or an error message string
+        """
+        payload = {
+            **self._DEFAULT_PAYLOAD,
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_content}
+            ]
+        }
+        
+        try:
+            response = self._request_with_retry(payload)
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code == 429:
+                return "Erro: Limite de taxa da API excedido. Tente novamente em alguns minutos."
+            return f"{error_prefix}: {str(e)}"
+        except requests.exceptions.RequestException as e:
+            return f"{error_prefix}: {str(e)}"
+        
+        try:
+            with response:
+                result = self._read_stream(response)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            return f"{error_prefix}: {str(e)}"
+        if result:
+            return result
+        return "Erro na resposta da API: formato inesperado."
+
     def classify_news(self, articles: List[Dict]) -> str:
         """
         Classify news articles using ZAI GLM API.
         
+        Large article sets are split into batches of Config.ZAI_BATCH_SIZE
+        and classified concurrently, so total latency stays near a single
+        model call instead of growing with the article count.
+        
         Args:
             articles: List of article dictionaries with title, description, source, and publishedAt
             
@@ -33,101 +251,127 @@ class ZAIClassifier:
         if not articles:
             return "Nenhuma notícia para classificar."
         
-        # Build the news data string
-        news_data = ""
+        # Overlapping queries routinely return the same article more than
+        # once; duplicates only inflate prompt tokens (and thus latency)
+        seen = set()
+        unique = []
+        for article in articles:
+            ident = article.get("url") or article.get("title")
+            if ident and ident not in seen:
+                seen.add(ident)
+                unique.append(article)
+        if len(unique) < len(articles):
+            _dbg(f"DEBUG: Dropped {len(articles) - len(unique)} duplicate articles before classification")
+        articles = unique
+        if not articles:
+            return "Nenhuma notícia para classificar."
+        
+        key = self._articles_key(articles)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        batch_size = Config.ZAI_BATCH_SIZE
+        if len(articles) <= batch_size:
+            result = self._classify_batch(articles)
+            self._cache_put(key, result)
+            return result
+
+        batches = [articles[i:i + batch_size]
+                   for i in range(0, len(articles), batch_size)]
+        with ThreadPoolExecutor(max_workers=min(4, len(batches))) as pool:
+            batch_results = list(pool.map(self._classify_batch, batches))
+        result = "\n\n".join(batch_results)
+        # _cache_put only rejects results that *start* with an error; a
+        # failed non-first batch would hide inside the joined string and
+        # get served from cache on retry, so check every batch here
+        if not any(r.startswith("Erro") for r in batch_results):
+            self._cache_put(key, result)
+        return result
+    
+    @staticmethod
+    def _format_articles(articles: List[Dict]) -> str:
+        """
+        Render articles into the prompt's news-data block.
+
+        Args:
+            articles: List of article dictionaries
+
+        Returns:
+            The formatted news data string
+        """
+        # Build the news data string (join once instead of quadratic +=)
+        parts = []
         for i, article in enumerate(articles, 1):
             title = article.get('title', 'N/A')
-            description = article.get('description', 'N/A')
+            # Descriptions only guide selection; cap them to keep the
+            # prompt short
+            description = (article.get('description') or 'N/A')[:400]
             source = article.get('source', {}).get('name', 'N/A')
             published_at = article.get('publishedAt', 'N/A')
-            
-            news_data += f"\nNotícia {i}\n"
-            news_data += f"Título: {title}\n"
-            news_data += f"Descrição: {description}\n"
-            news_data += f"Fonte: {source}\n"
-            news_data += f"Data: {published_at}\n"
-        
-        # Implement exponential backoff for rate limiting
-        max_retries = 3
-        base_delay = 2  # seconds
-        
-        for attempt in range(max_retries):
-            try:
-                # Add small delay before request to avoid rate limit
-                if attempt > 0:
-                    delay = base_delay * (2 ** attempt)
-                    print(f"Rate limit detected. Waiting {delay} seconds before retry {attempt + 1}/{max_retries}...")
-                    time.sleep(delay)
-                else:
-                    # Initial small delay for first request
-                    time.sleep(0.5)
-                
-                # Build the request
-                url = f"{self.api_base}/chat/completions"
-                headers = {
-                    "Accept-Language": "en-US,en",
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                }
-                
-                payload = {
-                    "model": self.model,
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": ZAIPrompts.CLASSIFY_NEWS
-                        },
-                        {
-                            "role": "user",
-                            "content": news_data
-                        }
-                    ],
-                    "temperature": 1,
-                    "stream": False,
-                    "do_sample": True,
-                    "thinking": {
-                        "type": "enabled",
-                        "clear_thinking": True
-                    },
-                    "top_p": 0.95,
-                    "tool_stream": False,
-                    "response_format": {"type": "text"}
-                }
-                
-                response = requests.post(
-                    url,
-                    headers=headers,
-                    json=payload,
-                    timeout=self.timeout
-                )
-                
-                # Check for rate limit error
-                if response.status_code == 429:
-                    if attempt < max_retries - 1:
-                        # Will retry in next iteration with exponential backoff
-                        continue
-                    else:
-                        return "Erro: Limite de taxa da API excedido. Tente novamente em alguns minutos."
-                
-                response.raise_for_status()
-                result = response.json()
-                
-                # Extract the classification result
-                if "choices" in result and len(result["choices"]) > 0:
-                    return result["choices"][0]["message"]["content"]
-                else:
-                    return "Erro na resposta da API: formato inesperado."
-                    
-            except requests.exceptions.HTTPError as e:
-                if e.response and e.response.status_code == 429:
-                    # Rate limit error - will retry
-                    continue
-                return f"Erro ao classificar notícias: {str(e)}"
-            except requests.exceptions.RequestException as e:
-                return f"Erro ao classificar notícias: {str(e)}"
-        
-        # If we get here, all retries failed
-        return "Erro: Não foi possível classificar após múltiplas tentativas. Tente novamente mais tarde."
+
+            parts.append(f"\nNotícia {i}\n"
+                         f"Título: {title}\n"
+                         f"Descrição: {description}\n"
+                         f"Fonte: {source}\n"
+                         f"Data: {published_at}\n")
+        return "".join(parts)
+
+    def _classify_batch(self, articles: List[Dict]) -> str:
+        """
+        Classify one batch of articles with a single API call.
+
+        Args:
+            articles: List of article dictionaries
+
+        Returns:
+            Classification result as a string
+        """
+        news_data = self._format_articles(articles)
+
+        return self._chat(ZAIPrompts.CLASSIFY_NEWS, news_data, "Erro ao classificar notícias")
+
+    # Line separating the two sections of a combined-pipeline response
+    _POST_MARKER = "===POST==="
+
+    def classify_and_post(self, articles: List[Dict]) -> tuple:
+        """
+        Classify articles and generate the LinkedIn post for them.
+
+        With Config.ZAI_COMBINED_PIPELINE enabled, both steps run as a
+        single chat call: the model replies with the classification, a
+        marker line, then the post, saving one round trip and a second
+        pass over the article tokens. With the flag off (the default)
+        this falls back to the existing two-call path, so current
+        callers keep their behavior.
+
+        Args:
+            articles: List of article dictionaries
+
+        Returns:
+            A (classification, post) tuple of strings
+        """
+        if not Config.ZAI_COMBINED_PIPELINE:
+            classification = self.classify_news(articles)
+            return classification, self.generate_linkedin_post(classification)
+
+        if not articles:
+            return "Nenhuma notícia para classificar.", ""
+
+        user_content = (
+            f"{self._format_articles(articles)}\n\n"
+            "Depois de classificar as notícias acima, aplique também a "
+            "instrução a seguir ao resultado da classificação e separe as "
+            "duas respostas com uma linha contendo apenas "
+            f"'{self._POST_MARKER}':\n\n"
+            f"{ZAIPrompts.GENERATE_LINKEDIN_POST}"
+        )
+        result = self._chat(ZAIPrompts.CLASSIFY_NEWS, user_content,
+                            "Erro ao classificar notícias")
+        if result.startswith("Erro"):
+            return result, ""
+        classification, _, post = result.partition(self._POST_MARKER)
+        return classification.strip(), post.strip()
     
     def generate_linkedin_post_from_article(self, article: dict, comment: str = "") -> str:
         """
@@ -149,102 +393,21 @@ class ZAIClassifier:
         source = article.get('source', {}).get('name', 'N/A')
         url = article.get('url', 'N/A')
         
-        # Build the article data string
-        article_data = f"Título: {title}\n"
-        article_data += f"Descrição: {description}\n"
-        article_data += f"Fonte: {source}\n"
-        article_data += f"Link: {url}\n"
-        
         # Build the prompt with article data and optional comment
-        user_content = ZAIPrompts.GENERATE_LINKEDIN_POST + "\n\n"
-        user_content += "Aqui estão os detalhes do artigo selecionado:\n\n"
-        user_content += article_data
+        user_content = (
+            f"{ZAIPrompts.GENERATE_LINKEDIN_POST}\n\n"
+            "Aqui estão os detalhes do artigo selecionado:\n\n"
+            f"Título: {title}\n"
+            f"Descrição: {description}\n"
+            f"Fonte: {source}\n"
+            f"Link: {url}\n"
+        )
         
         # Add comment if provided
         if comment:
             user_content += f"\n\nComentário/instrução adicional:\n{comment}"
         
-        # Implement exponential backoff for rate limiting
-        max_retries = 3
-        base_delay = 2  # seconds
-        
-        for attempt in range(max_retries):
-            try:
-                # Add small delay before request to avoid rate limit
-                if attempt > 0:
-                    delay = base_delay * (2 ** attempt)
-                    print(f"Rate limit detected. Waiting {delay} seconds before retry {attempt + 1}/{max_retries}...")
-                    time.sleep(delay)
-                else:
-                    # Initial small delay for first request
-                    time.sleep(0.5)
-                
-                # Build the request
-                url = f"{self.api_base}/chat/completions"
-                headers = {
-                    "Accept-Language": "en-US,en",
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                }
-                
-                payload = {
-                    "model": self.model,
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": "Você é um assistente útil que gera posts de LinkedIn."
-                        },
-                        {
-                            "role": "user",
-                            "content": user_content
-                        }
-                    ],
-                    "temperature": 1,
-                    "stream": False,
-                    "do_sample": True,
-                    "thinking": {
-                        "type": "enabled",
-                        "clear_thinking": True
-                    },
-                    "top_p": 0.95,
-                    "tool_stream": False,
-                    "response_format": {"type": "text"}
-                }
-                
-                response = requests.post(
-                    url,
-                    headers=headers,
-                    json=payload,
-                    timeout=self.timeout
-                )
-                
-                # Check for rate limit error
-                if response.status_code == 429:
-                    if attempt < max_retries - 1:
-                        # Will retry in next iteration with exponential backoff
-                        continue
-                    else:
-                        return "Erro: Limite de taxa da API excedido. Tente novamente em alguns minutos."
-                
-                response.raise_for_status()
-                result = response.json()
-                
-                # Extract the LinkedIn post
-                if "choices" in result and len(result["choices"]) > 0:
-                    return result["choices"][0]["message"]["content"]
-                else:
-                    return "Erro na resposta da API: formato inesperado."
-                    
-            except requests.exceptions.HTTPError as e:
-                if e.response and e.response.status_code == 429:
-                    # Rate limit error - will retry
-                    continue
-                return f"Erro ao gerar post: {str(e)}"
-            except requests.exceptions.RequestException as e:
-                return f"Erro ao gerar post: {str(e)}"
-        
-        # If we get here, all retries failed
-        return "Erro: Não foi possível gerar o post após múltiplas tentativas. Tente novamente mais tarde."
+        return self._chat("Você é um assistente útil que gera posts de LinkedIn.", user_content, "Erro ao gerar post")
     
     def generate_linkedin_post_direct(self, input_text: str) -> str:
         """
@@ -262,87 +425,7 @@ class ZAIClassifier:
         # Build the prompt with direct input
         user_content = ZAIPrompts.GENERATE_LINKEDIN_POST + "\n\n" + input_text
         
-        # Implement exponential backoff for rate limiting
-        max_retries = 3
-        base_delay = 2  # seconds
-        
-        for attempt in range(max_retries):
-            try:
-                # Add small delay before request to avoid rate limit
-                if attempt > 0:
-                    delay = base_delay * (2 ** attempt)
-                    print(f"Rate limit detected. Waiting {delay} seconds before retry {attempt + 1}/{max_retries}...")
-                    time.sleep(delay)
-                else:
-                    # Initial small delay for first request
-                    time.sleep(0.5)
-                
-                # Build the request
-                url = f"{self.api_base}/chat/completions"
-                headers = {
-                    "Accept-Language": "en-US,en",
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                }
-                
-                payload = {
-                    "model": self.model,
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": "Você é um assistente útil que gera posts de LinkedIn."
-                        },
-                        {
-                            "role": "user",
-                            "content": user_content
-                        }
-                    ],
-                    "temperature": 1,
-                    "stream": False,
-                    "do_sample": True,
-                    "thinking": {
-                        "type": "enabled",
-                        "clear_thinking": True
-                    },
-                    "top_p": 0.95,
-                    "tool_stream": False,
-                    "response_format": {"type": "text"}
-                }
-                
-                response = requests.post(
-                    url,
-                    headers=headers,
-                    json=payload,
-                    timeout=self.timeout
-                )
-                
-                # Check for rate limit error
-                if response.status_code == 429:
-                    if attempt < max_retries - 1:
-                        # Will retry in next iteration with exponential backoff
-                        continue
-                    else:
-                        return "Erro: Limite de taxa da API excedido. Tente novamente em alguns minutos."
-                
-                response.raise_for_status()
-                result = response.json()
-                
-                # Extract the LinkedIn post
-                if "choices" in result and len(result["choices"]) > 0:
-                    return result["choices"][0]["message"]["content"]
-                else:
-                    return "Erro na resposta da API: formato inesperado."
-                    
-            except requests.exceptions.HTTPError as e:
-                if e.response and e.response.status_code == 429:
-                    # Rate limit error - will retry
-                    continue
-                return f"Erro ao gerar post: {str(e)}"
-            except requests.exceptions.RequestException as e:
-                return f"Erro ao gerar post: {str(e)}"
-        
-        # If we get here, all retries failed
-        return "Erro: Não foi possível gerar o post após múltiplas tentativas. Tente novamente mais tarde."
+        return self._chat("Você é um assistente útil que gera posts de LinkedIn.", user_content, "Erro ao gerar post")
     
     def generate_linkedin_post(self, classification_text: str) -> str:
         """
@@ -357,87 +440,29 @@ class ZAIClassifier:
         if not classification_text:
             return "Nenhuma classificação disponível para gerar post."
         
+        key = "p:" + hashlib.blake2b(classification_text.encode(),
+                                     digest_size=16).hexdigest()
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
         # Build the prompt with classification text
         user_content = ZAIPrompts.GENERATE_LINKEDIN_POST + "\n\n" + classification_text
         
-        # Implement exponential backoff for rate limiting
-        max_retries = 3
-        base_delay = 2  # seconds
-        
-        for attempt in range(max_retries):
-            try:
-                # Add small delay before request to avoid rate limit
-                if attempt > 0:
-                    delay = base_delay * (2 ** attempt)
-                    print(f"Rate limit detected. Waiting {delay} seconds before retry {attempt + 1}/{max_retries}...")
-                    time.sleep(delay)
-                else:
-                    # Initial small delay for first request
-                    time.sleep(0.5)
-                
-                # Build the request
-                url = f"{self.api_base}/chat/completions"
-                headers = {
-                    "Accept-Language": "en-US,en",
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                }
-                
-                payload = {
-                    "model": self.model,
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": "Você é um assistente útil que gera posts de LinkedIn."
-                        },
-                        {
-                            "role": "user",
-                            "content": user_content
-                        }
-                    ],
-                    "temperature": 1,
-                    "stream": False,
-                    "do_sample": True,
-                    "thinking": {
-                        "type": "enabled",
-                        "clear_thinking": True
-                    },
-                    "top_p": 0.95,
-                    "tool_stream": False,
-                    "response_format": {"type": "text"}
-                }
-                
-                response = requests.post(
-                    url,
-                    headers=headers,
-                    json=payload,
-                    timeout=self.timeout
-                )
-                
-                # Check for rate limit error
-                if response.status_code == 429:
-                    if attempt < max_retries - 1:
-                        # Will retry in next iteration with exponential backoff
-                        continue
-                    else:
-                        return "Erro: Limite de taxa da API excedido. Tente novamente em alguns minutos."
-                
-                response.raise_for_status()
-                result = response.json()
-                
-                # Extract the LinkedIn post
-                if "choices" in result and len(result["choices"]) > 0:
-                    return result["choices"][0]["message"]["content"]
-                else:
-                    return "Erro na resposta da API: formato inesperado."
-                    
-            except requests.exceptions.HTTPError as e:
-                if e.response and e.response.status_code == 429:
-                    # Rate limit error - will retry
-                    continue
-                return f"Erro ao gerar post: {str(e)}"
-            except requests.exceptions.RequestException as e:
-                return f"Erro ao gerar post: {str(e)}"
-        
-        # If we get here, all retries failed
-        return "Erro: Não foi possível gerar o post após múltiplas tentativas. Tente novamente mais tarde."
+        result = self._chat("Você é um assistente útil que gera posts de LinkedIn.", user_content, "Erro ao gerar post")
+        self._cache_put(key, result)
+        return result
+
+@functools.lru_cache(maxsize=1)
+def get_zai_classifier() -> ZAIClassifier:
+    """
+    Return the shared ZAIClassifier instance.
+
+    Keeps one pooled session (and one result cache) for the whole
+    process instead of rebuilding them per caller; the session is safe
+    for concurrent requests.
+
+    Returns:
+        The process-wide ZAIClassifier
+    """
+    return ZAIClassifier()
@@ -1,149 +1,36 @@
 """
 ZAI Prompts Module
-Contains all prompts used for ZAI GLM API interactions.
-"""
-
-
-class ZAIPrompts:
-    """Container for all ZAI prompts."""
-    
-    CLASSIFY_NEWS = """Você é um curador crítico de notícias com foco em tecnologia, programação, negócios, economia, política, geopolítica, gestão e impactos estratégicos em IT.
-
-Você receberá uma lista de notícias contendo apenas:
-
-título
-
-descrição
-
-fonte
-
-data
-
-Regras obrigatórias:
-
-Não invente fatos, números ou citações.
-
-Não presuma conteúdo além do título e da descrição.
-
-Ignore notícias triviais, esportivas sem impacto estrutural, entretenimento, fofoca ou curiosidade.
-
-Evite notícias promocionais, publicitárias ou de baixa credibilidade.
-
-Evite religião, gênero ou temas culturais sem impacto estratégico.
-
-Evite LGBTQIA+.
-
-Avalie pensando em leitura crítica profissional, não em consumo casual.
-
-Critérios de seleção:
-
-Impacto estratégico ou simbólico real
-
-Potencial de análise crítica ou questionamento
-
-Relação com decisões, poder, tecnologia, mercado ou comportamento coletivo
-
-Credibilidade da fonte
-
-Tarefa:
-
-Avalie todas as notícias recebidas.
-
-Selecione apenas as 3 mais relevantes.
-
-Para cada notícia selecionada, indique o formato de saída mais impactante (escolha entre: manchete chamativa, análise detalhada, post LinkedIn engajador, lista de insights estratégicos, thread resumida com pontos críticos, provocação direta).
-
-Se houver menos de 3 que atendam aos critérios, retorne apenas as válidas.
-
-Se nenhuma atender, retorne exatamente:
-"Nenhuma notícia relevante neste lote."
-
-Formato de saída (OBRIGATÓRIO):
-
-Notícia 1
-Título: …
-Fonte: …
-Motivo da escolha: …
-Ângulo crítico possível: …
-Formato sugerido: …
-
-Notícia 2
-…
+Loads the prompts used for ZAI GLM API interactions.
 
-Notícia 3
-…
-
-Importante:
-
-Não explique o processo de decisão.
-
-Não resuma a notícia.
-
-Não retorne mais de 3 itens.
-
-Pense como alguém que escreve para LinkedIn profissional e crítico."""
-    
-    GENERATE_LINKEDIN_POST = """Você é um escritor crítico, provocador e estrategista de tecnologia, programação, negócios, economia, política, geopolítica e impactos em IT. Sua voz é firme, direta e pronta para LinkedIn.
-
-Você receberá uma notícia bruta contendo:
-
-título
-
-descrição
-
-fonte
-
-data
-
-Regras obrigatórias:
-
-Não invente fatos, números ou citações.
-
-Não presuma conteúdo além do fornecido.
-
-Ignore trivialidades, esportes sem impacto estratégico, entretenimento, fofoca ou curiosidade.
-
-Evite publicidade, religião, gênero ou temas culturais sem impacto estratégico.
-
-Avalie para leitura crítica profissional, não consumo casual.
-
-Tarefa:
-
-Escolha o formato mais impactante entre:
-
-Post LinkedIn engajador
-
-Thread resumida com pontos críticos
-
-Lista de insights estratégicos
-
-Provocação direta
-
-Gere o post otimizado para engajamento máximo:
-
-Gancho chamativo na primeira linha
-
-Frases curtas, diretas e escaneáveis
-
-Pontos numerados ou bullets visuais
-
-Análise crítica e impacto estratégico conectados a poder, mercado, tecnologia ou comportamento coletivo
+The prompt texts live in prompts/*.txt so editing them doesn't require a
+code change; each file is read once, on first access.
+"""
 
-Pergunta ou provocação distribuída para engajar o leitor
+import functools
+from pathlib import Path
 
-Máximo 150 palavras (ou 200 para threads)
 
-Inclua fonte e link no final
+@functools.lru_cache(maxsize=None)
+def _load(name: str) -> str:
+    """Read a prompt file from the prompts directory (cached)."""
+    return (Path(__file__).parent / "prompts" / name).read_text(encoding="utf-8")
 
-Evite formalidade excessiva, frases pesadas ou robóticas
 
-Importante:
+class _PromptMeta(type):
+    """Resolves prompt class attributes lazily from their backing files."""
 
-Escreva de forma natural, com ritmo que prenda atenção no feed.
+    _FILES = {
+        "CLASSIFY_NEWS": "classify_news.txt",
+        "GENERATE_LINKEDIN_POST": "generate_linkedin_post.txt",
+    }
 
-Não explique o processo de decisão.
+    def __getattr__(cls, name):
+        try:
+            filename = cls._FILES[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        return _load(filename)
 
-Não resuma a notícia.
 
-Sempre entregue pronta para LinkedIn.
-"""
+class ZAIPrompts(metaclass=_PromptMeta):
+    """Container for all ZAI prompts."""